@@ -0,0 +1,239 @@
+import difflib
+import logging
+import re
+import threading
+from typing import Dict, List, Optional
+
+from answer_cache import normalize_question
+from instrumentation import metrics
+
+# Answer key -> pattern over the normalized field label. All patterns are
+# compiled into one alternation, so classifying a label is a single search;
+# the leftmost match wins, and earlier entries win ties.
+DEFAULT_PATTERNS = {
+    "years_experience": r"how many years|years of (?:\w+ )?experience",
+    "first_name": r"\bfirst name\b|\bgiven name\b",
+    "last_name": r"\blast name\b|\bsurname\b|\bfamily name\b",
+    "full_name": r"^(?:full )?name$",
+    "email": r"\be-?mail\b",
+    "country_code": r"\bcountry code\b",
+    # The leftmost match wins, so phone must not claim "Phone country code"
+    "phone": r"\b(?:mobile|phone|cell)\b(?!(?: phone)?(?: number)? country code\b)"
+    r"(?: phone)?(?: number)?\b",
+    "sponsorship": r"\bsponsorship\b|\bvisa\b",
+    "work_authorization": r"\bauthori[sz]ed to work\b|\bwork authori[sz]ation\b",
+    "relocate": r"\breloca",
+    "commute": r"\bcommut",
+    "remote": r"\bremote\b",
+    "salary": r"\bsalary\b|\bcompensation\b|\bpay expectations?\b|\bexpected pay\b",
+    "notice_period": r"\bnotice period\b|\bwhen can you start\b|\bstart date\b",
+    "linkedin": r"\blinkedin\b",
+    "website": r"\bwebsite\b|\bportfolio\b|\bgithub\b",
+    "city": r"^(?:current )?(?:city|location)\b|\bwhere are you (?:located|based)\b",
+}
+
+# Pulls the skill out of "How many years of experience do you have with Python?"
+SKILL_PATTERN = re.compile(
+    r"(?:experience|worked|working)\b.*?\b(?:with|in|using|on|of)\s+(.+)$"
+)
+# ...and out of "Years of Python experience"
+SKILL_BEFORE_PATTERN = re.compile(r"\byears of (.+?) experience\b")
+GENERIC_SKILLS = ("work", "professional", "relevant", "industry", "total")
+
+# Answers that mean the same as a Yes/No option
+YES_NO = {
+    "yes": ("yes", "y", "true", "i am", "i do", "i have", "i will", "correct"),
+    "no": (
+        "no",
+        "n",
+        "false",
+        "never",
+        "none",
+        "i am not",
+        "i do not",
+        "i don't",
+        "i have not",
+        "i haven't",
+        "i have never",
+        "i have no",
+        "i will not",
+    ),
+}
+
+
+def match_option(answer: str, options: List[str]) -> Optional[str]:
+    """The option an answer refers to, or None if it matches none of them.
+
+    Tries an exact match, then Yes/No synonyms, then containment either way,
+    then the closest spelling.
+    """
+    text = normalize_question(answer).strip(" .!\"'")
+    if not text or not options:
+        return None
+    lowered = {option.lower(): option for option in options}
+    if text in lowered:
+        return lowered[text]
+    # Longest synonym wins, so "i do not" beats "i do"
+    best, best_length = None, 0
+    for option_text, option in lowered.items():
+        for synonym in YES_NO.get(option_text, ()):
+            if len(synonym) > best_length and re.match(
+                rf"{re.escape(synonym)}\b", text
+            ):
+                best, best_length = option, len(synonym)
+    if best is not None:
+        return best
+    # Whole words only, so "No" is not found in "I know" or "Unknown"
+    contained = [
+        option
+        for key, option in lowered.items()
+        if key and re.search(rf"(?<!\w){re.escape(key)}(?!\w)", text)
+    ]
+    if len(contained) == 1:
+        return contained[0]
+    containing = [
+        option
+        for key, option in lowered.items()
+        if re.search(rf"(?<!\w){re.escape(text)}(?!\w)", key)
+    ]
+    if len(containing) == 1:
+        return containing[0]
+    if re.fullmatch(r"\d+(?:\.\d+)?", text):
+        ranged = _option_for_number(float(text), options)
+        if ranged is not None:
+            return ranged
+    close = difflib.get_close_matches(text, list(lowered), n=1, cutoff=0.6)
+    return lowered[close[0]] if close else None
+
+
+def _option_for_number(number: float, options: List[str]) -> Optional[str]:
+    """Option whose range ("1-3 years", "5+", "Less than 1 year") holds number"""
+    for option in options:
+        text = option.lower()
+        bounds = [float(value) for value in re.findall(r"\d+(?:\.\d+)?", text)]
+        if not bounds:
+            continue
+        if len(bounds) >= 2 and bounds[0] <= number <= bounds[1]:
+            return option
+        if len(bounds) == 1:
+            if re.search(r"less than|under|below|<", text):
+                if number < bounds[0]:
+                    return option
+            elif re.search(r"\+|more than|over|at least|above|or more", text):
+                if number >= bounds[0]:
+                    return option
+            elif number == bounds[0]:
+                return option
+    return None
+
+
+class AnswerBank:
+    """Answers deterministic form fields locally, before any GPT request.
+
+    Answers come from the configured answer table, the contact details parsed
+    from the resume, and years of experience derived from the dated experience
+    entries. Custom patterns map a label regex straight to an answer.
+    """
+
+    def __init__(
+        self,
+        resume_parser=None,
+        answers: Optional[Dict[str, str]] = None,
+        custom_patterns: Optional[Dict[str, str]] = None,
+    ):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.resume_parser = resume_parser
+        self.answers = self._profile(resume_parser)
+        for key, value in (answers or {}).items():
+            self.answers[key] = str(value)
+        self.fields_seen = 0
+        self.fields_resolved = 0
+        self._lock = threading.Lock()
+
+        # Custom patterns go first so they can override the built-in ones
+        self._custom_answers = {}
+        alternatives = []
+        for index, (pattern, answer) in enumerate((custom_patterns or {}).items()):
+            self._custom_answers[f"custom{index}"] = str(answer)
+            alternatives.append(f"(?P<custom{index}>{pattern})")
+        for key, pattern in DEFAULT_PATTERNS.items():
+            alternatives.append(f"(?P<{key}>{pattern})")
+        self._pattern = re.compile("|".join(alternatives), re.IGNORECASE)
+
+    @staticmethod
+    def _profile(resume_parser) -> Dict[str, str]:
+        if resume_parser is None:
+            return {}
+        contact = dict(resume_parser.contact)
+        profile = {
+            key: contact[key] for key in ("email", "phone", "city") if key in contact
+        }
+        names = contact.get("name", "").split()
+        # A first line like "Curriculum Vitae 2024" is not a name to type in
+        if 2 <= len(names) <= 4 and not re.search(r"[\d@]", contact["name"]):
+            profile["full_name"] = contact["name"]
+            profile["first_name"] = names[0]
+            profile["last_name"] = names[-1]
+        url = contact.get("url", "")
+        if "linkedin.com" in url:
+            profile["linkedin"] = url
+        elif url:
+            profile["website"] = url
+        return profile
+
+    def classify(self, label: str) -> Optional[str]:
+        """Answer key for a field label, or None when no rule applies"""
+        match = self._pattern.search(normalize_question(label))
+        return match.lastgroup if match else None
+
+    def resolve(self, label: str) -> Optional[str]:
+        """Local answer for a label, or None when it needs GPT"""
+        key = self.classify(label)
+        if key is None:
+            return None
+        if key in self._custom_answers:
+            return self._custom_answers[key]
+        if key == "years_experience":
+            return self._years_experience(normalize_question(label))
+        return self.answers.get(key)
+
+    def _years_experience(self, label: str) -> Optional[str]:
+        match = SKILL_PATTERN.search(label) or SKILL_BEFORE_PATTERN.search(label)
+        skill = match.group(1).strip(" ?.") if match else ""
+        if skill.startswith(GENERIC_SKILLS) or skill in ("it", "this"):
+            skill = ""
+        if not skill:
+            if "years_experience" in self.answers:
+                return self.answers["years_experience"]
+            if self.resume_parser is not None:
+                return str(self.resume_parser.years_of_experience())
+            return None
+        if self.resume_parser is None:
+            return None
+        years = self.resume_parser.years_of_experience(skill)
+        # Zero usually means the skill is named differently; leave it to GPT
+        return str(years) if years else None
+
+    def resolve_fields(self, fields: List[Dict]) -> Dict[str, str]:
+        """Map field id to local answer for the fields that have one"""
+        answers = {}
+        for field in fields:
+            answer = self.resolve(field["label"])
+            if answer:
+                answers[field["id"]] = answer
+        with self._lock:
+            self.fields_seen += len(fields)
+            self.fields_resolved += len(answers)
+        metrics.incr("answers.fields", len(fields))
+        metrics.incr("answers.local", len(answers))
+        if answers:
+            self.logger.debug(
+                "Answered %d of %d fields locally", len(answers), len(fields)
+            )
+        return answers
+
+    def resolved_fraction(self) -> float:
+        with self._lock:
+            if not self.fields_seen:
+                return 0.0
+            return self.fields_resolved / self.fields_seen
@@ -0,0 +1,161 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a field label so trivially different labels share a cache entry"""
+    text = question.lower().strip()
+    text = re.sub(r"[\s\*:?]+$", "", text)
+    return re.sub(r"\s+", " ", text)
+
+
+def fingerprint(text: str) -> str:
+    """Short stable hash used to tie cached answers to a resume or context"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class AnswerCache:
+    """SQLite-backed answer cache with an in-memory LRU in front of it"""
+
+    def __init__(
+        self,
+        path: str = "cache/answers.sqlite3",
+        max_memory_entries: int = 512,
+        ttl_seconds: Optional[float] = 30 * 24 * 3600,
+    ):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS answers (
+                key TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS answers_question ON answers (question)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        question: str,
+        resume_fingerprint: str,
+        model: str,
+        prompt_version: str,
+        context: str = "",
+    ) -> str:
+        """Build the cache key for a question under a given resume/model/prompt"""
+        parts = [
+            normalize_question(question),
+            resume_fingerprint,
+            model,
+            prompt_version,
+            fingerprint(context) if context else "",
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached answer for key, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                answer, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return answer
+                del self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT answer, expires_at FROM answers WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.misses += 1
+                return None
+
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, question: str, answer: str, ttl_seconds=None):
+        """Store an answer in memory and on disk"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._remember(key, answer, expires_at)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers (key, question, answer, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, normalize_question(question), answer, now, expires_at),
+            )
+            self._conn.commit()
+
+    def invalidate(self, question: Optional[str] = None) -> int:
+        """Drop cached answers for one question, or everything when no question is given"""
+        with self._lock:
+            if question is None:
+                cursor = self._conn.execute("DELETE FROM answers")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM answers WHERE question = ?",
+                    (normalize_question(question),),
+                )
+            self._conn.commit()
+            # Memory entries are keyed by hash only, so drop them all to stay consistent
+            self._memory.clear()
+            return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from disk"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM answers WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key, answer, expires_at):
+        self._memory[key] = (answer, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
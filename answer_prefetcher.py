@@ -0,0 +1,133 @@
+import logging
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor, wait
+from typing import Dict, List
+
+from answer_cache import normalize_question
+from gpt_handler import GPTHandler
+
+
+# Labels that show up on most Easy Apply forms, warmed as soon as a job is opened
+DEFAULT_LIKELY_QUESTIONS = [
+    "Mobile phone number",
+    "City",
+    "Email address",
+    "How many years of work experience do you have?",
+    "Are you legally authorized to work in this country?",
+    "Will you now or in the future require sponsorship for employment visa status?",
+]
+
+
+class AnswerPrefetcher:
+    """Request GPT answers in the background so form filling only waits on futures"""
+
+    def __init__(
+        self, gpt_handler: GPTHandler, max_workers: int = 2, max_in_flight: int = 4
+    ):
+        self.gpt_handler = gpt_handler
+        self.logger = logging.getLogger("linkedin_bot")
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gpt-prefetch"
+        )
+        # Bounds the number of queued + running batches; extra prefetches are dropped
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    @staticmethod
+    def _key(label: str, context: str) -> str:
+        return f"{normalize_question(label)}\x1f{context}"
+
+    def prefetch_fields(self, fields: List[Dict], context: str = "") -> int:
+        """Start answering harvested fields; returns how many were submitted"""
+        with self._lock:
+            todo = [
+                field
+                for field in fields
+                if self._key(field["label"], context) not in self._in_flight
+            ]
+            if not todo or not self._slots.acquire(blocking=False):
+                return 0
+
+            request = [
+                {
+                    key: field[key]
+                    for key in ("id", "label", "options", "long")
+                    if key in field
+                }
+                for field in todo
+            ]
+            future = self._executor.submit(
+                self.gpt_handler.generate_batch_responses, request, context
+            )
+            # Runs on completion and on cancellation, so the slot is never leaked
+            future.add_done_callback(lambda _: self._slots.release())
+            for field in todo:
+                self._in_flight[self._key(field["label"], context)] = (
+                    future,
+                    field["id"],
+                )
+
+        self.logger.debug("Prefetching answers for %d fields", len(todo))
+        return len(todo)
+
+    def prefetch_questions(self, labels: List[str], context: str = "") -> int:
+        """Warm the answer cache for questions we expect to be asked"""
+        fields = [
+            {"id": f"likely-{index}", "label": label}
+            for index, label in enumerate(labels)
+        ]
+        return self.prefetch_fields(fields, context)
+
+    def collect(self, fields: List[Dict], context: str = "") -> Dict[str, str]:
+        """Wait for answers already in flight for these fields.
+
+        Returns a mapping from field id to answer for the fields that had a
+        prefetch running; the caller answers the rest itself.
+        """
+        answers = {}
+        for field in fields:
+            with self._lock:
+                entry = self._in_flight.pop(self._key(field["label"], context), None)
+            if entry is None:
+                continue
+            future, submitted_id = entry
+            try:
+                answer = future.result().get(submitted_id)
+            except CancelledError:
+                continue
+            except Exception as e:
+                self.logger.error(f"Prefetched answer failed: {str(e)}")
+                continue
+            if answer:
+                answers[field["id"]] = answer
+        return answers
+
+    def cancel(self):
+        """Drop pending prefetches, e.g. when the current job is skipped"""
+        with self._lock:
+            futures = {future for future, _ in self._in_flight.values()}
+            self._in_flight.clear()
+        cancelled = sum(1 for future in futures if future.cancel())
+        if futures:
+            self.logger.debug(
+                "Cancelled %d of %d pending answer prefetches", cancelled, len(futures)
+            )
+
+    def shutdown(self, timeout: float = 5.0):
+        """Cancel queued prefetches and give running ones timeout seconds to end.
+
+        Call before closing the GPT client and answer cache the workers use.
+        """
+        with self._lock:
+            futures = {future for future, _ in self._in_flight.values()}
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # A cancelled future never counts as done for wait()
+        running = [future for future in futures if not future.cancelled()]
+        _, running = wait(running, timeout=timeout)
+        if running:
+            self.logger.warning(
+                "%d answer prefetches still running at shutdown", len(running)
+            )
+
@@ -0,0 +1,208 @@
+"""End-to-end benchmark of LinkedInBot against the local replay site.
+
+Runs the bot headless against benchmarks/replay_server.py with a stub GPT
+endpoint and a virtual pacing clock, so no network access is needed and the
+deliberate delays are accounted for without being slept. Needs Chrome and a
+chromedriver on PATH (or Edge with --browser edge).
+
+    python benchmarks/bench_bot.py --jobs 30 --limit 5
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from replay_server import ReplayServer  # noqa: E402
+
+# Bot methods timed as phases; nested phases are reported independently
+PHASES = [
+    "setup_driver",
+    "login",
+    "load_search_page",
+    "open_job",
+    "handle_application_form",
+    "fill_form_fields",
+]
+
+RESUME_TEXT = """Jane Replay
+jane@example.com | +1 555 0100 | Austin, TX
+
+Summary
+Data engineer with 6 years of experience building pipelines in Python and SQL.
+
+Experience
+Senior Data Engineer, Globex (2020 - Present)
+- Built streaming pipelines with Python, Kafka and Spark
+Data Engineer, Initech (2018 - 2020)
+- Maintained the SQL warehouse and Airflow jobs
+
+Skills
+Python, SQL, Spark, Airflow, AWS
+
+Education
+B.S. Computer Science, State University
+"""
+
+
+def write_config(workdir, base_url, args):
+    resume_path = os.path.join(workdir, "resume.txt")
+    with open(resume_path, "w", encoding="utf-8") as f:
+        f.write(RESUME_TEXT)
+
+    config = {
+        "email": "replay@example.com",
+        "password": "replay",
+        "openai_api_key": "sk-replay",
+        "openai_api_base": f"{base_url}/v1",
+        "resume_path": resume_path,
+        "job_title": "Data Engineer",
+        "location": "Remote",
+        "base_url": base_url,
+        "browser": args.browser,
+        "headless": not args.headed,
+        "daily_application_limit": args.limit,
+        "max_search_pages": args.max_pages,
+    }
+    config_path = os.path.join(workdir, "config.json")
+    with open(config_path, "w") as f:
+        json.dump(config, f, indent=2)
+    return config_path
+
+
+class Timings:
+    """Wraps bot methods to accumulate wall time and call counts per phase"""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self._originals = []
+
+    def wrap(self, obj, name):
+        original = getattr(obj, name)
+        self._originals.append((obj, name, original))
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.seconds[name] += time.perf_counter() - started
+                self.calls[name] += 1
+
+        setattr(obj, name, timed)
+
+    def restore(self):
+        for obj, name, original in reversed(self._originals):
+            setattr(obj, name, original)
+        self._originals = []
+
+
+def count_driver_commands(driver, counter):
+    """Count every WebDriver HTTP command the bot issues"""
+    original = driver.execute
+
+    def execute(command, params=None):
+        counter[command] += 1
+        return original(command, params)
+
+    driver.execute = execute
+
+
+def run_benchmark(args):
+    # Imported here so --help works without selenium installed
+    from linkedin_bot import LinkedInBot
+    from pacing import VirtualClock
+
+    timings = Timings()
+    commands = defaultdict(int)
+    original_cwd = os.getcwd()
+
+    with ReplayServer(jobs=args.jobs, latency_ms=args.latency_ms) as server:
+        with tempfile.TemporaryDirectory() as workdir:
+            config_path = write_config(workdir, server.base_url, args)
+            # The bot keeps logs/ and cache/ relative to the working directory
+            os.chdir(workdir)
+            try:
+                for name in PHASES:
+                    timings.wrap(LinkedInBot, name)
+                started = time.perf_counter()
+                bot = LinkedInBot(config_path=config_path, clock=VirtualClock())
+                startup = time.perf_counter() - started
+
+                count_driver_commands(bot.driver, commands)
+                started = time.perf_counter()
+                bot.run()
+                run_time = time.perf_counter() - started
+            finally:
+                os.chdir(original_cwd)
+                timings.restore()
+
+        stats = server.state.stats()
+
+    jobs_opened = max(1, timings.calls["open_job"])
+    submitted = len(stats["applications"])
+    report = {
+        "startup_seconds": startup,
+        "run_seconds": run_time,
+        "phases": {
+            name: {"seconds": timings.seconds[name], "calls": timings.calls[name]}
+            for name in PHASES
+        },
+        "jobs_opened": timings.calls["open_job"],
+        "applications_claimed": bot.applications_today,
+        "applications_submitted": submitted,
+        "driver_commands": sum(commands.values()),
+        "driver_commands_per_job": sum(commands.values()) / jobs_opened,
+        "top_driver_commands": dict(
+            sorted(commands.items(), key=lambda item: -item[1])[:8]
+        ),
+        "gpt_calls": stats["gpt_calls"],
+        "gpt_calls_per_application": stats["gpt_calls"] / max(1, submitted),
+        "gpt_prompt_tokens": stats["gpt_prompt_tokens"],
+        "page_loads": stats["page_loads"],
+        "deliberate_delay_seconds": bot.scheduler.total_delay,
+    }
+    return report
+
+
+def print_report(report):
+    print(f"{'phase':<26}{'calls':>8}{'seconds':>12}")
+    for name, phase in report["phases"].items():
+        print(f"{name:<26}{phase['calls']:>8}{phase['seconds']:>12.2f}")
+    print()
+    for key, value in report.items():
+        if key == "phases":
+            continue
+        if isinstance(value, float):
+            value = f"{value:.2f}"
+        print(f"{key:<30}{value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the bot offline")
+    parser.add_argument("--jobs", type=int, default=30, help="synthetic postings")
+    parser.add_argument("--limit", type=int, default=5, help="applications to make")
+    parser.add_argument("--max-pages", type=int, default=2)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--browser", choices=["chrome", "edge"], default="chrome")
+    parser.add_argument("--headed", action="store_true", help="show the browser")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Startup-time benchmark for LinkedInBot.
+
+Measures, against the local replay site:
+- importing linkedin_bot in a fresh interpreter,
+- constructing the bot with an empty cache directory (cold start),
+- constructing it again with the driver cache populated (warm start),
+- constructing it when today's application budget is already spent.
+
+    python benchmarks/bench_startup.py --repeat 3
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_bot import REPO_ROOT, write_config
+from replay_server import ReplayServer
+
+
+def time_import(repeat):
+    code = (
+        "import time; started = time.perf_counter(); import linkedin_bot; "
+        "print(time.perf_counter() - started)"
+    )
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return samples
+
+
+def time_construct(config_path, workdir):
+    from linkedin_bot import LinkedInBot
+    from pacing import VirtualClock
+
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        started = time.perf_counter()
+        bot = LinkedInBot(config_path=config_path, clock=VirtualClock())
+        elapsed = time.perf_counter() - started
+        if bot.driver is not None:
+            bot.driver.quit()
+        return elapsed
+    finally:
+        os.chdir(original_cwd)
+
+
+def spend_budget(workdir, limit):
+    from job_index import APPLIED, JobIndex
+
+    index = JobIndex(os.path.join(workdir, "cache", "jobs.sqlite3"))
+    for number in range(limit):
+        index.mark(f"startup-bench-{number}", APPLIED)
+    index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bot startup offline")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--browser", choices=["chrome", "edge"], default="chrome")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+    # write_config expects the bench_bot options
+    args.limit = 5
+    args.max_pages = 1
+
+    results = {"import": time_import(args.repeat), "cold": [], "warm": [], "spent": []}
+    with ReplayServer() as server:
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as workdir:
+                config_path = write_config(workdir, server.base_url, args)
+                results["cold"].append(time_construct(config_path, workdir))
+                results["warm"].append(time_construct(config_path, workdir))
+                spend_budget(workdir, args.limit)
+                results["spent"].append(time_construct(config_path, workdir))
+
+    print(f"{'startup path':<16}{'median s':>10}{'min s':>10}{'max s':>10}")
+    for name, samples in results.items():
+        print(
+            f"{name:<16}{statistics.median(samples):>10.3f}"
+            f"{min(samples):>10.3f}{max(samples):>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
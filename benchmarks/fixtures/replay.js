@@ -0,0 +1,188 @@
+// Synthetic stand-in for the LinkedIn jobs UI. Only the structure the bot
+// relies on is reproduced: class names, aria-labels and data attributes.
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text == null ? '' : String(text);
+    return div.innerHTML;
+}
+
+function later(callback) {
+    setTimeout(callback, window.REPLAY.latency_ms);
+}
+
+function renderResults(jobs) {
+    const list = document.getElementById('results');
+    list.innerHTML = jobs.map((job) => `
+        <li class="jobs-search-results__list-item">
+          <div class="job-card-container" data-job-id="${job.id}">
+            <a class="job-card-list__title" href="/jobs/view/${job.id}/">${escapeHtml(job.title)}</a>
+            <div class="artdeco-entity-lockup__subtitle">${escapeHtml(job.company)}</div>
+            <ul><li class="job-card-container__metadata-item">${escapeHtml(job.location)}</li></ul>
+            <time datetime="${job.posted}">${escapeHtml(job.posted)}</time>
+            ${job.easy_apply ? '<span class="job-card-container__apply-method">Easy Apply</span>' : ''}
+          </div>
+        </li>`).join('');
+
+    list.querySelectorAll('a.job-card-list__title').forEach((link) => {
+        link.addEventListener('click', (event) => {
+            event.preventDefault();
+            const id = link.closest('[data-job-id]').getAttribute('data-job-id');
+            const job = jobs.find((candidate) => String(candidate.id) === id);
+            document.getElementById('details').innerHTML = '';
+            later(() => renderDetails(job));
+        });
+    });
+}
+
+function renderDetails(job) {
+    const details = document.getElementById('details');
+    const button = job.easy_apply
+        ? `<button class="jobs-apply-button artdeco-button artdeco-button--3 artdeco-button--primary"
+                   aria-label="Easy Apply to ${escapeHtml(job.title)} at ${escapeHtml(job.company)}"
+                   data-job-id="${job.id}" data-live-test-job-apply-button="">
+             <span class="artdeco-button__text">Easy Apply</span>
+           </button>`
+        : `<button class="jobs-apply-button artdeco-button artdeco-button--3" aria-label="Apply on company website">
+             <span class="artdeco-button__text">Apply</span>
+           </button>`;
+
+    details.innerHTML = `
+        <div class="jobs-details" data-job-id="${job.id}">
+          <h2 class="job-details-jobs-unified-top-card__job-title">${escapeHtml(job.title)}</h2>
+          <div class="job-details-jobs-unified-top-card__company-name">
+            <a href="#">${escapeHtml(job.company)}</a>
+          </div>
+          <div class="job-details-jobs-unified-top-card__primary-description-container">
+            ${escapeHtml(job.location)} · ${escapeHtml(job.posted)}
+          </div>
+          <div class="jobs-apply-button--top-card">${button}</div>
+          <article class="jobs-description__container">
+            <div class="jobs-description__content jobs-box__html-content" id="job-details">
+              ${job.description}
+            </div>
+          </article>
+        </div>`;
+
+    const apply = details.querySelector('button[data-live-test-job-apply-button]');
+    if (apply) {
+        apply.addEventListener('click', () => later(() => openEasyApply(job)));
+    }
+}
+
+function renderField(field, stepIndex, fieldIndex) {
+    const id = `field-${stepIndex}-${fieldIndex}`;
+    const required = field.required ? 'required aria-required="true"' : '';
+    let control;
+    if (field.type === 'select') {
+        control = `
+            <label for="${id}">${escapeHtml(field.label)}</label>
+            <select id="${id}" ${required}>
+              <option value="">Select an option</option>
+              ${field.options.map((option) => `<option value="${escapeHtml(option)}">${escapeHtml(option)}</option>`).join('')}
+            </select>`;
+    } else if (field.type === 'radio') {
+        control = `
+            <fieldset data-test-form-builder-radio-button-form-component="true">
+              <legend>${escapeHtml(field.label)}</legend>
+              ${field.options.map((option, optionIndex) => `
+                <div>
+                  <input type="radio" id="${id}-${optionIndex}" name="${id}" value="${escapeHtml(option)}" ${required}>
+                  <label for="${id}-${optionIndex}">${escapeHtml(option)}</label>
+                </div>`).join('')}
+            </fieldset>`;
+    } else if (field.type === 'checkbox') {
+        control = `
+            <input type="checkbox" id="${id}" ${required}>
+            <label for="${id}">${escapeHtml(field.label)}</label>`;
+    } else if (field.type === 'textarea') {
+        control = `
+            <label for="${id}">${escapeHtml(field.label)}</label>
+            <textarea id="${id}" ${required}>${escapeHtml(field.value || '')}</textarea>`;
+    } else {
+        control = `
+            <label for="${id}">${escapeHtml(field.label)}</label>
+            <input type="${field.type}" id="${id}" value="${escapeHtml(field.value || '')}" ${required}>`;
+    }
+    return `<div class="fb-dash-form-element" data-field-index="${fieldIndex}">${control}</div>`;
+}
+
+function fieldAnswered(container, field) {
+    if (field.type === 'radio') return !!container.querySelector('input:checked');
+    if (field.type === 'checkbox') return container.querySelector('input').checked;
+    const control = container.querySelector('input, select, textarea');
+    return !!control.value.trim();
+}
+
+function openEasyApply(job) {
+    const steps = window.REPLAY.form_steps;
+    let stepIndex = 0;
+
+    const modal = document.createElement('div');
+    modal.className = 'jobs-easy-apply-modal artdeco-modal';
+    modal.setAttribute('role', 'dialog');
+    modal.setAttribute('aria-labelledby', 'jobs-apply-header');
+    document.body.appendChild(modal);
+
+    const close = () => modal.remove();
+
+    const renderStep = () => {
+        const step = steps[stepIndex];
+        const last = stepIndex === steps.length - 1;
+        const review = stepIndex === steps.length - 2;
+        const progress = Math.round((stepIndex / (steps.length - 1)) * 100);
+        let action = '<button class="artdeco-button artdeco-button--primary" aria-label="Continue to next step"><span>Next</span></button>';
+        if (review) {
+            action = '<button class="artdeco-button artdeco-button--primary" aria-label="Review your application"><span>Review</span></button>';
+        } else if (last) {
+            action = '<button class="artdeco-button artdeco-button--primary" aria-label="Submit application"><span>Submit application</span></button>';
+        }
+
+        modal.innerHTML = `
+            <button class="artdeco-modal__dismiss" aria-label="Dismiss">×</button>
+            <h2 id="jobs-apply-header">Apply to ${escapeHtml(job.company)}</h2>
+            <progress max="100" value="${progress}" aria-label="Your job application progress is at ${progress} percent."></progress>
+            <h3 class="t-16 t-bold">${escapeHtml(step.title)}</h3>
+            <form>${step.fields.map((field, index) => renderField(field, stepIndex, index)).join('')}</form>
+            <footer>${action}</footer>`;
+
+        modal.querySelector('button[aria-label="Dismiss"]').addEventListener('click', close);
+        modal.querySelector('footer button').addEventListener('click', (event) => {
+            event.preventDefault();
+            modal.querySelectorAll('.artdeco-inline-feedback--error').forEach((node) => node.remove());
+
+            let valid = true;
+            modal.querySelectorAll('.fb-dash-form-element').forEach((container) => {
+                const field = step.fields[Number(container.dataset.fieldIndex)];
+                if (field.required && !fieldAnswered(container, field)) {
+                    valid = false;
+                    container.insertAdjacentHTML('beforeend',
+                        '<div class="artdeco-inline-feedback artdeco-inline-feedback--error" role="alert">' +
+                        '<span class="artdeco-inline-feedback__message">Please enter a valid answer</span></div>');
+                }
+            });
+            if (!valid) return;
+
+            if (last) {
+                fetch('/api/applications', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({job_id: job.id}),
+                }).then(() => later(renderConfirmation));
+            } else {
+                stepIndex += 1;
+                later(renderStep);
+            }
+        });
+    };
+
+    const renderConfirmation = () => {
+        modal.innerHTML = `
+            <h2 id="post-apply-modal">Application sent</h2>
+            <p class="jpac-modal-header">Your application was sent to ${escapeHtml(job.company)}!</p>
+            <button class="artdeco-button" aria-label="Dismiss"><span>Done</span></button>`;
+        modal.querySelector('button[aria-label="Dismiss"]').addEventListener('click', close);
+    };
+
+    renderStep();
+}
@@ -0,0 +1,295 @@
+"""Local HTTP server that replays a synthetic LinkedIn jobs site and a stub GPT API.
+
+Run it on its own to click through the fixtures in a browser:
+
+    python benchmarks/replay_server.py --port 8765
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+TITLES = [
+    "Data Engineer",
+    "Machine Learning Engineer",
+    "Analytics Engineer",
+    "Backend Python Developer",
+    "Senior Data Scientist",
+]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Analytics", "Hooli"]
+LOCATIONS = ["Remote", "New York, NY", "Austin, TX", "Seattle, WA"]
+
+DEFAULT_FORM_STEPS = [
+    {
+        "title": "Contact info",
+        "fields": [
+            {"type": "text", "label": "First name", "value": "Replay"},
+            {"type": "tel", "label": "Mobile phone number", "required": True},
+            {"type": "text", "label": "City", "required": True},
+        ],
+    },
+    {
+        "title": "Additional questions",
+        "fields": [
+            {
+                "type": "text",
+                "label": "How many years of work experience do you have with Python?",
+                "required": True,
+            },
+            {
+                "type": "radio",
+                "label": "Are you legally authorized to work in this country?",
+                "options": ["Yes", "No"],
+                "required": True,
+            },
+            {
+                "type": "select",
+                "label": "Will you now or in the future require sponsorship for employment visa status?",
+                "options": ["Yes", "No"],
+                "required": True,
+            },
+            {
+                "type": "textarea",
+                "label": "Why are you interested in this role?",
+            },
+        ],
+    },
+    # The step before the last shows "Review", the last one "Submit application"
+    {"title": "Review your application", "fields": []},
+]
+
+
+def make_jobs(count):
+    """Deterministic synthetic postings; every fifth one is not Easy Apply"""
+    jobs = []
+    for index in range(count):
+        title = TITLES[index % len(TITLES)]
+        jobs.append(
+            {
+                "id": str(3900000000 + index),
+                "title": title,
+                "company": COMPANIES[index % len(COMPANIES)],
+                "location": LOCATIONS[index % len(LOCATIONS)],
+                "posted": f"{index % 23 + 1} hours ago",
+                "easy_apply": index % 5 != 4,
+                "description": (
+                    f"<p>We are hiring a {title} to build reliable data products.</p>"
+                    "<h3>Requirements</h3><ul>"
+                    "<li>3+ years of experience with Python</li>"
+                    "<li>Experience with SQL and cloud data warehouses</li>"
+                    "<li>Strong communication skills</li></ul>"
+                ),
+            }
+        )
+    return jobs
+
+
+class ReplayState:
+    """Fixture data plus the counters the benchmark reads back"""
+
+    def __init__(self, jobs=30, page_size=25, latency_ms=150, form_steps=None):
+        self.jobs = make_jobs(jobs)
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        self.form_steps = form_steps or DEFAULT_FORM_STEPS
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.page_loads = 0
+            self.gpt_calls = 0
+            self.gpt_prompt_tokens = 0
+            self.gpt_completion_tokens = 0
+            self.applications = []
+
+    def stats(self):
+        with self.lock:
+            return {
+                "page_loads": self.page_loads,
+                "gpt_calls": self.gpt_calls,
+                "gpt_prompt_tokens": self.gpt_prompt_tokens,
+                "gpt_completion_tokens": self.gpt_completion_tokens,
+                "applications": list(self.applications),
+            }
+
+
+def stub_answer(prompt):
+    """Answer like the bot's prompts expect, without any model"""
+    if "Reply with only a JSON object" in prompt:
+        start = prompt.find("[")
+        questions, _ = json.JSONDecoder().raw_decode(prompt[start:])
+        answers = {}
+        for question in questions:
+            if question.get("options"):
+                answers[question["id"]] = question["options"][0]
+            else:
+                answers[question["id"]] = stub_answer(question["question"])
+        return json.dumps(answers)
+    if re.search(r"years|how many|number", prompt, re.IGNORECASE):
+        return "3"
+    return "I am excited about this role because it matches my experience."
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(
+        self, status, body, content_type="text/html; charset=utf-8", headers=None
+    ):
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _page(self, name, data=None, headers=None):
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+            html = f.read()
+        if data is not None:
+            payload = dict(data, latency_ms=self.state.latency_ms)
+            payload["form_steps"] = self.state.form_steps
+            html = html.replace("__REPLAY_DATA__", json.dumps(payload))
+        with self.state.lock:
+            self.state.page_loads += 1
+        self._send(200, html, headers=headers)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path
+        if path in ("/", "/login"):
+            self._page("login.html")
+        elif path.startswith("/feed"):
+            self._page("feed.html", headers={"Set-Cookie": "li_at=replay; Path=/"})
+        elif path.startswith("/jobs/search"):
+            query = parse_qs(url.query)
+            start = int(query.get("start", ["0"])[0])
+            jobs = self.state.jobs[start : start + self.state.page_size]
+            self._page("search.html", {"jobs": jobs})
+        elif path.startswith("/jobs/view/"):
+            job_id = path.rstrip("/").split("/")[-1]
+            jobs = [job for job in self.state.jobs if job["id"] == job_id]
+            if not jobs:
+                self._send(404, "Job not found")
+                return
+            self._page("job.html", {"jobs": jobs})
+        elif path.startswith("/static/"):
+            name = os.path.basename(path)
+            file_path = os.path.join(FIXTURES_DIR, name)
+            if not os.path.exists(file_path):
+                self._send(404, "Not found")
+                return
+            with open(file_path, "rb") as f:
+                self._send(200, f.read(), "application/javascript")
+        else:
+            self._send(404, "Not found")
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path == "/api/applications":
+            body = self._read_json()
+            with self.state.lock:
+                self.state.applications.append(body.get("job_id"))
+            self._send(200, "{}", "application/json")
+        elif path.endswith("/chat/completions"):
+            self._chat_completion(self._read_json())
+        else:
+            self._send(404, "Not found")
+
+    def _chat_completion(self, request):
+        prompt = "\n".join(
+            message.get("content", "") for message in request.get("messages", [])
+        )
+        answer = stub_answer(prompt)
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(answer) // 4
+        with self.state.lock:
+            self.state.gpt_calls += 1
+            self.state.gpt_prompt_tokens += prompt_tokens
+            self.state.gpt_completion_tokens += completion_tokens
+        self._send(
+            200,
+            json.dumps(
+                {
+                    "id": "chatcmpl-replay",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": request.get("model", "stub"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": answer},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                }
+            ),
+            "application/json",
+        )
+
+
+class ReplayServer:
+    """Runs the replay site on a background thread"""
+
+    def __init__(self, port=0, **state_options):
+        self.state = ReplayState(**state_options)
+        handler = type("BoundReplayHandler", (ReplayHandler,), {"state": self.state})
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jobs", type=int, default=30)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    args = parser.parse_args()
+
+    server = ReplayServer(port=args.port, jobs=args.jobs, latency_ms=args.latency_ms)
+    print(f"Serving replay site on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
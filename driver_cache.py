@@ -0,0 +1,49 @@
+import json
+import logging
+import os
+import time
+from typing import Optional
+
+
+class DriverCache:
+    """Remembers resolved WebDriver binaries so startup skips driver resolution"""
+
+    def __init__(self, path: str = "cache/driver.json", max_age_days: float = 7):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.path = path
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable driver cache: {str(e)}")
+
+    def get(self, browser: str) -> Optional[str]:
+        """Cached driver path for browser, or None when missing, stale or deleted"""
+        entry = self.entries.get(browser)
+        if not entry:
+            return None
+        if time.time() - entry["resolved_at"] > self.max_age_seconds:
+            return None
+        if not os.path.exists(entry["path"]):
+            return None
+        return entry["path"]
+
+    def store(self, browser: str, driver_path: str):
+        self.entries[browser] = {"path": driver_path, "resolved_at": time.time()}
+        self._save()
+
+    def invalidate(self, browser: str):
+        if self.entries.pop(browser, None) is not None:
+            self._save()
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.path)
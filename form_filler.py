@@ -0,0 +1,354 @@
+import logging
+import re
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+
+from answer_bank import match_option
+
+
+# Collects every visible, editable control of the current form step in one
+# round trip. Each control is tagged with a data-bot-field attribute so it can
+# be located again later without relying on ids that LinkedIn regenerates.
+HARVEST_FIELDS_SCRIPT = """
+const root = document.querySelector('.jobs-easy-apply-modal, [role="dialog"]') || document;
+window.__botFieldSeq = window.__botFieldSeq || 0;
+
+const clean = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const tag = (el) => {
+    if (!el.dataset.botField) {
+        el.dataset.botField = String(window.__botFieldSeq++);
+    }
+    return el.dataset.botField;
+};
+const labelFor = (el) => {
+    if (el.id) {
+        const label = root.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+        if (label) return clean(label.innerText);
+    }
+    const wrapping = el.closest('label');
+    if (wrapping) return clean(wrapping.innerText);
+    const labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy) {
+        const text = labelledBy.split(/\\s+/)
+            .map((id) => document.getElementById(id))
+            .filter(Boolean)
+            .map((node) => node.innerText)
+            .join(' ');
+        if (clean(text)) return clean(text);
+    }
+    return clean(el.getAttribute('aria-label'));
+};
+const required = (el) => el.required || el.getAttribute('aria-required') === 'true';
+// "Select an option" and the like: choosing it means no answer
+const placeholderOption = (option) => !option.value || option.disabled
+    || /^(-+\s*)?(select|choose|please select|pick)\b/i.test(clean(option.text));
+// Inline validation message LinkedIn shows under a field after a failed submit
+const errorFor = (el) => {
+    const container = el.closest('fieldset, .fb-dash-form-element, .jobs-easy-apply-form-element, .jobs-easy-apply-form-section__grouping');
+    const error = container && container.querySelector('.artdeco-inline-feedback--error');
+    return error ? clean(error.innerText) : '';
+};
+
+const skipTypes = ['hidden', 'submit', 'button', 'reset', 'image', 'file'];
+const fields = [];
+const groups = {};
+
+root.querySelectorAll('input, textarea, select').forEach((el) => {
+    const type = el.tagName === 'INPUT' ? (el.type || 'text').toLowerCase() : el.tagName.toLowerCase();
+    if (skipTypes.includes(type) || el.disabled || el.readOnly || !visible(el)) return;
+
+    if (type === 'radio') {
+        // Radios sharing a name become one descriptor; every radio in the group
+        // carries the same data-bot-field so the locator matches all options
+        const name = el.name || tag(el);
+        let group = groups[name];
+        if (!group) {
+            const fieldset = el.closest('fieldset');
+            const legend = fieldset && fieldset.querySelector('legend');
+            group = groups[name] = {
+                tag: 'input', type: 'radio', label: legend ? clean(legend.innerText) : '',
+                placeholder: '', value: '', required: false, options: [],
+                error: errorFor(el),
+                locator: `[data-bot-field="${tag(el)}"]`,
+                fieldId: el.dataset.botField,
+            };
+            fields.push(group);
+        }
+        el.dataset.botField = group.fieldId;
+        const optionLabel = labelFor(el) || el.value;
+        group.options.push(optionLabel);
+        group.required = group.required || required(el);
+        if (el.checked) group.value = optionLabel;
+        return;
+    }
+
+    const descriptor = {
+        tag: el.tagName.toLowerCase(),
+        type: type,
+        label: labelFor(el) || clean(el.placeholder),
+        placeholder: clean(el.placeholder),
+        value: el.value || '',
+        required: required(el),
+        options: [],
+        error: errorFor(el),
+        locator: `[data-bot-field="${tag(el)}"]`,
+    };
+    if (type === 'checkbox') {
+        descriptor.value = el.checked ? 'true' : '';
+    } else if (type === 'select') {
+        descriptor.options = Array.from(el.options)
+            .filter((option) => !placeholderOption(option))
+            .map((option) => clean(option.text));
+        const selected = el.options[el.selectedIndex];
+        descriptor.value = selected && !placeholderOption(selected) ? clean(selected.text) : '';
+    }
+    fields.push(descriptor);
+});
+
+return fields;
+"""
+
+# Field types answered with free text
+TEXT_FIELD_TYPES = ("text", "textarea", "email", "tel", "url", "search")
+# Field types answered by picking one of the harvested options
+CHOICE_FIELD_TYPES = ("select", "radio")
+# Field types whose value has to be a number or an ISO date
+NUMBER_FIELD_TYPES = ("number",)
+DATE_FIELD_TYPES = ("date",)
+
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%d %B %Y",
+)
+# A number with optional separators and a thousand or million suffix
+NUMBER_PATTERN = re.compile(r"(-?\d+(?:[.,]\d+)*)\s*([km])?(?![a-z])", re.IGNORECASE)
+# "120,000" or "1.234.567": one separator grouping every three digits
+GROUPED_PATTERN = re.compile(r"\d{1,3}(?:([.,])\d{3})(?:\1\d{3})*")
+MULTIPLIERS = {"": 1, "k": 1000, "m": 1000000}
+# Answers meaning the earliest possible date
+IMMEDIATE_ANSWERS = ("immediately", "asap", "now", "today")
+
+# Picks a select option or radio button by its visible text and fires the
+# events the page listens for; returns false when no option matches
+SET_CHOICE_SCRIPT = """
+const [locator, choice] = arguments;
+const clean = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const controls = Array.from(document.querySelectorAll(locator));
+if (!controls.length) return false;
+
+if (controls[0].tagName === 'SELECT') {
+    const select = controls[0];
+    const option = Array.from(select.options).find((o) => clean(o.text) === choice);
+    if (!option) return false;
+    select.value = option.value;
+    select.dispatchEvent(new Event('input', {bubbles: true}));
+    select.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+}
+
+const labelText = (el) => {
+    const label = el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+    return clean(label ? label.innerText : (el.closest('label') || {}).innerText);
+};
+const radio = controls.find((el) => labelText(el) === choice || el.value === choice);
+if (!radio) return false;
+if (!radio.checked) radio.click();
+return true;
+"""
+
+# Sets a field's value in one call and fires input/change so the page sees it.
+# Goes through the prototype's value setter because React-controlled inputs
+# ignore a plain assignment. Used for dates and for long text answers.
+SET_VALUE_SCRIPT = """
+const [element, value] = arguments;
+let proto = Object.getPrototypeOf(element);
+let descriptor = null;
+while (proto && !(descriptor = Object.getOwnPropertyDescriptor(proto, 'value'))) {
+    proto = Object.getPrototypeOf(proto);
+}
+element.focus();
+if (descriptor && descriptor.set) {
+    descriptor.set.call(element, value);
+} else {
+    element.value = value;
+}
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+return element.value;
+"""
+
+# How free text is entered: one send_keys per character, per chunk, a single
+# script call, or "auto" (chunks for short answers, a script call for long ones)
+INPUT_STRATEGIES = ("keys", "chunked", "script", "auto")
+AUTO_SCRIPT_MIN_LENGTH = 80
+
+logger = logging.getLogger("linkedin_bot")
+
+
+def harvest_fields(driver) -> List[Dict]:
+    """Snapshot the visible, editable controls of the current form step"""
+    fields = driver.execute_script(HARVEST_FIELDS_SCRIPT) or []
+    for index, field in enumerate(fields):
+        field.pop("fieldId", None)
+        field["id"] = str(index)
+    logger.debug("Harvested %d form fields", len(fields))
+    return fields
+
+
+def needs_answer(field: Dict) -> bool:
+    """True for empty, labelled fields the bot knows how to fill.
+
+    Checkboxes only count when required, e.g. a terms or consent box.
+    """
+    if not field["label"] or field["value"]:
+        return False
+    if field["type"] == "checkbox":
+        return field["required"]
+    return field["type"] in (
+        TEXT_FIELD_TYPES + CHOICE_FIELD_TYPES + NUMBER_FIELD_TYPES + DATE_FIELD_TYPES
+    )
+
+
+def preset_answer(field: Dict) -> Optional[str]:
+    """Answer known from the field alone, without the label"""
+    if field["type"] == "checkbox":
+        return "true"
+    return None
+
+
+def prepare_value(field: Dict, answer: str) -> Optional[str]:
+    """Coerce an answer to what the field accepts, or None if it cannot be"""
+    answer = (answer or "").strip()
+    if not answer:
+        return None
+    if field["type"] in CHOICE_FIELD_TYPES:
+        return match_option(answer, field["options"])
+    if field["type"] in NUMBER_FIELD_TYPES:
+        return _number(answer)
+    if field["type"] in DATE_FIELD_TYPES:
+        for date_format in DATE_FORMATS:
+            try:
+                return datetime.strptime(answer, date_format).date().isoformat()
+            except ValueError:
+                continue
+        if answer.lower().strip(" .!") in IMMEDIATE_ANSWERS:
+            return date.today().isoformat()
+        return None
+    return answer
+
+
+def _number(answer: str) -> Optional[str]:
+    """The first number in answer in plain form, or None if it is ambiguous.
+
+    Reads "120,000", "1.234,56", "3,5" and "$120k"; a lone separator followed
+    by three digits, as in "1.234", is taken as a thousands separator only
+    when it is a comma.
+    """
+    match = NUMBER_PATTERN.search(answer)
+    if not match:
+        return None
+    number, suffix = match.group(1), (match.group(2) or "").lower()
+    sign = "-" if number.startswith("-") else ""
+    digits = number.lstrip("-")
+    separators = set(re.sub(r"\d", "", digits))
+    if len(separators) == 2:
+        # "1,234.56" or "1.234,56": the last separator is the decimal point
+        point = "." if digits.rfind(".") > digits.rfind(",") else ","
+        whole, _, fraction = digits.rpartition(point)
+        if not GROUPED_PATTERN.fullmatch(whole):
+            return None
+        digits = re.sub(r"[.,]", "", whole) + "." + fraction
+    elif GROUPED_PATTERN.fullmatch(digits) and (
+        "," in separators or digits.count(".") > 1
+    ):
+        digits = re.sub(r"[.,]", "", digits)
+    elif digits.count(",") + digits.count(".") > 1:
+        return None
+    else:
+        digits = digits.replace(",", ".")
+    value = float(digits) * MULTIPLIERS[suffix]
+    if value.is_integer():
+        return f"{sign}{int(value)}"
+    return f"{sign}{value:g}" if suffix else f"{sign}{digits}"
+
+
+def fill_field(driver, field: Dict, value: str, type_text: Callable):
+    """Put value into a field, dispatching on the field type.
+
+    type_text(element, text) enters free text so the caller controls pacing,
+    and returns False when the field did not keep the text. Raises ValueError
+    when the field could not be set.
+    """
+    if field["type"] in CHOICE_FIELD_TYPES:
+        if not driver.execute_script(SET_CHOICE_SCRIPT, field["locator"], value):
+            raise ValueError(f"Option {value!r} not found for {field['label']!r}")
+        return
+    element = locate(driver, field)
+    if field["type"] == "checkbox":
+        if not element.is_selected():
+            driver.execute_script("arguments[0].click();", element)
+    elif field["type"] in DATE_FIELD_TYPES:
+        driver.execute_script(SET_VALUE_SCRIPT, element, value)
+    else:
+        if field["value"]:
+            # Replacing an answer the form rejected
+            element.clear()
+        if not type_text(element, value):
+            raise ValueError(f"Field {field['label']!r} did not keep the answer")
+
+
+def enter_text(
+    driver,
+    element,
+    text: str,
+    strategy: str = "auto",
+    chunk_size: int = 20,
+    pause: Optional[Callable] = None,
+) -> bool:
+    """Enter text with the given strategy and check the field kept it.
+
+    pause() runs after every key or chunk, so the caller controls pacing.
+    Returns False when the field ends up holding something else.
+    """
+    if strategy == "auto":
+        strategy = "script" if len(text) >= AUTO_SCRIPT_MIN_LENGTH else "chunked"
+    if strategy == "script":
+        value = driver.execute_script(SET_VALUE_SCRIPT, element, text)
+    else:
+        size = 1 if strategy == "keys" else max(1, chunk_size)
+        for start in range(0, len(text), size):
+            element.send_keys(text[start : start + size])
+            if pause is not None:
+                pause()
+        value = element.get_attribute("value")
+
+    if _same_text(value, text):
+        return True
+    value = value or ""
+    if strategy != "script" and _same_text(text[: len(value)], value):
+        # Keystrokes were dropped (the page re-rendered mid-typing); set it whole
+        logger.debug("Typed value incomplete, setting it directly")
+        value = driver.execute_script(SET_VALUE_SCRIPT, element, text)
+        if _same_text(value, text):
+            return True
+    # Input masks and maxlength legitimately rewrite what was entered
+    logger.warning(
+        "Field holds %r instead of the %d-character answer", value, len(text)
+    )
+    return False
+
+
+def _same_text(actual: Optional[str], expected: str) -> bool:
+    return " ".join((actual or "").split()) == " ".join(expected.split())
+
+
+def locate(driver, field: Dict):
+    """Resolve a harvested descriptor back to its WebElement"""
+    return driver.find_element(By.CSS_SELECTOR, field["locator"])
@@ -0,0 +1,144 @@
+import logging
+from typing import Dict, Optional
+
+# Step kinds reported by wait_for_step()
+NEXT = "next"
+REVIEW = "review"
+SUBMIT = "submit"
+CONFIRMATION = "confirmation"
+CLOSED = "closed"
+
+# Footer buttons of the Easy Apply modal, by step kind
+ACTION_LABELS = {
+    NEXT: "Continue to next step",
+    REVIEW: "Review your application",
+    SUBMIT: "Submit application",
+}
+
+# Waits inside the page for the Easy Apply modal to settle on a step. A
+# MutationObserver re-checks the modal on every change, so this returns as
+# soon as a new step (or the confirmation) renders instead of after a fixed
+# pause. A step counts as new when its signature (action, progress bar value
+# and heading) differs from the previous one, or when its action button is not
+# the one clicked last. Validation errors that outlive the grace period are
+# reported as a blocked step.
+WAIT_FOR_STEP_SCRIPT = """
+const [previous, timeoutMs, graceMs, actionLabels] = arguments;
+const done = arguments[arguments.length - 1];
+
+const snapshot = () => {
+    const root = document.querySelector('.jobs-easy-apply-modal, [role="dialog"]');
+    if (!root) {
+        return {kind: 'closed', signature: ''};
+    }
+    if (root.querySelector('#post-apply-modal, .jpac-modal-header, [data-test-modal-id="post-apply-modal"]')) {
+        return {
+            kind: 'confirmation',
+            signature: 'confirmation',
+            button: root.querySelector('button[aria-label="Dismiss"]'),
+        };
+    }
+    let kind = null;
+    let button = null;
+    for (const [name, label] of Object.entries(actionLabels)) {
+        button = root.querySelector(`button[aria-label="${label}"]`);
+        if (button) {
+            kind = name;
+            break;
+        }
+    }
+    const progress = root.querySelector('progress, [role="progressbar"]');
+    const heading = root.querySelector('h3');
+    return {
+        kind: kind,
+        button: button,
+        ready: !!button && !button.disabled,
+        fresh: !!button && !button.dataset.botClicked,
+        errors: root.querySelectorAll('.artdeco-inline-feedback--error').length,
+        signature: [
+            kind,
+            progress ? (progress.getAttribute('value') || progress.getAttribute('aria-valuenow') || '') : '',
+            heading ? heading.textContent.trim() : '',
+        ].join('|'),
+    };
+};
+
+let finished = false;
+let graceTimer = null;
+let observer = null;
+const finish = (state) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(graceTimer);
+    clearTimeout(deadline);
+    done(state);
+};
+
+const check = () => {
+    const state = snapshot();
+    if (state.kind === 'confirmation') return finish(state);
+    if (state.kind === 'closed') {
+        // Before the first click a missing modal just means it has not opened yet
+        if (previous !== null) finish(state);
+        return;
+    }
+    if (!state.ready) return;
+    if (previous === null || state.fresh || state.signature !== previous) {
+        return finish(state);
+    }
+    if (state.errors && graceTimer === null) {
+        graceTimer = setTimeout(() => {
+            const current = snapshot();
+            current.blocked = current.signature === previous && !current.fresh;
+            finish(current);
+        }, graceMs);
+    }
+};
+
+const deadline = setTimeout(() => finish(null), timeoutMs);
+observer = new MutationObserver(check);
+observer.observe(document.body, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    attributeFilter: ['value', 'aria-valuenow', 'aria-label', 'disabled', 'class'],
+});
+check();
+"""
+
+# Marks the action button as clicked so wait_for_step() can tell a re-rendered
+# step from the one just left, then clicks it
+CLICK_ACTION_SCRIPT = """
+const button = arguments[0];
+button.dataset.botClicked = '1';
+button.click();
+"""
+
+logger = logging.getLogger("linkedin_bot")
+
+
+def wait_for_step(
+    driver, previous: Optional[str] = None, timeout: float = 15, error_grace=1.0
+) -> Optional[Dict]:
+    """Wait for the next form step, the confirmation, or the modal closing.
+
+    previous is the signature of the step whose button was just clicked, or
+    None before the first step. Returns the step state (kind, signature,
+    button, errors, blocked) or None on timeout.
+    """
+    state = driver.execute_async_script(
+        WAIT_FOR_STEP_SCRIPT,
+        previous,
+        int(timeout * 1000),
+        int(error_grace * 1000),
+        ACTION_LABELS,
+    )
+    if state is not None:
+        logger.debug("Form step: %s (%s)", state["kind"], state["signature"])
+    return state
+
+
+def advance(driver, state: Dict):
+    """Click the action button of the current step"""
+    driver.execute_script(CLICK_ACTION_SCRIPT, state["button"])
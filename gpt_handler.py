@@ -1,38 +1,280 @@
-import openai
-from typing import Dict
+from typing import Callable, Dict, List, Optional
+import json
 import logging
+import re
+
+from answer_bank import match_option
+from answer_cache import AnswerCache, fingerprint
+from instrumentation import metrics
+from llm_client import LLMClient
+from prompt_builder import PromptBuilder
+
+
+SYSTEM_PROMPT = "You are a helpful assistant creating job application responses."
+
+# Cache key question for the one-time resume summary
+SUMMARY_QUESTION = "__resume_summary__"
 
 
 class GPTHandler:
-    def __init__(self, api_key: str, resume_content: str):
-        openai.api_key = api_key
+    # Bump whenever the prompt text changes so cached answers are not reused
+    PROMPT_VERSION = "2"
+
+    def __init__(
+        self,
+        client: LLMClient,
+        resume_content: str,
+        cache: Optional[AnswerCache] = None,
+        rate_limiter: Optional[Callable[[], None]] = None,
+        resume_sections: Optional[Dict[str, str]] = None,
+        prompt_token_budget: int = 600,
+    ):
+        self.client = client
         self.resume_content = resume_content
+        self.resume_fingerprint = fingerprint(resume_content)
+        self.cache = cache
+        # Called before every API request; blocks until a request is allowed
+        self.rate_limiter = rate_limiter
         self.logger = logging.getLogger("linkedin_bot")
+        # Sends only the resume sections relevant to each question
+        self.prompt_builder = PromptBuilder(
+            resume_content,
+            resume_sections,
+            token_budget=prompt_token_budget,
+            summary_loader=self._summarize_resume,
+        )
+
+    def _cache_key(self, question: str, context: str, model: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.make_key(
+            question,
+            self.resume_fingerprint,
+            model,
+            f"{self.PROMPT_VERSION}/{self.prompt_builder.token_budget}",
+            context,
+        )
+
+    def _lookup(
+        self, question: str, context: str, options=None, model=None, long=False
+    ):
+        """Return (cache_key, cached_answer); cached_answer is None on a miss.
+
+        Only long free-text answers are cached per context (i.e. per job); short
+        and choice answers are reused across jobs.
+        """
+        if not long:
+            context = ""
+        if options:
+            # A choice is only reusable for the same list of options
+            context = f"{context}\x1foptions:{'|'.join(options)}"
+        cache_key = self._cache_key(question, context, model or self.client.model)
+        if cache_key is None:
+            return None, None
+        return cache_key, self.cache.get(cache_key)
+
+    def _store(self, cache_key: Optional[str], question: str, answer: str):
+        if cache_key is not None and answer:
+            self.cache.set(cache_key, question, answer)
+
+    def _complete(self, prompt: str, model: Optional[str] = None) -> str:
+        if self.rate_limiter is not None:
+            self.rate_limiter()
+        return self.client.complete(
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            model=model,
+        )
+
+    def _summarize_resume(self) -> str:
+        """Ask once for a short resume summary; cached alongside the answers"""
+        cache_key, cached = self._lookup(SUMMARY_QUESTION, "")
+        if cached is not None:
+            return cached
+        summary = self._complete(
+            f"""
+            Summarize this resume in at most {self.prompt_builder.token_budget // 2}
+            words, keeping job titles, employers, dates, skills and education:
+
+            {self.resume_content}
+            """
+        )
+        self._store(cache_key, SUMMARY_QUESTION, summary)
+        return summary
+
+    @metrics.timed("gpt.generate_response")
+    def generate_response(
+        self,
+        question: str,
+        context: str = "",
+        options: Optional[List[str]] = None,
+        long: bool = False,
+    ) -> str:
+        """Answer one question; with options the answer is one of them or empty.
+
+        Short answers go to the fast model, long ones to the main model.
+        """
+        model = self.client.model_for(long)
+        cache_key, cached = self._lookup(question, context, options, model, long)
+        if cached is not None:
+            self.logger.debug("Answer cache hit for: %s", question)
+            metrics.incr("gpt.cache_hits")
+            return cached
 
-    def generate_response(self, question: str, context: str = "") -> str:
         try:
+            resume = self.prompt_builder.resume_context(question)
             prompt = f"""
-            Based on my resume: {self.resume_content}
-            
+            Based on my resume: {resume}
+
             And this additional context: {context}
-            
+
             Please provide a professional response to this question: {question}
-            
+
             Keep the response concise, professional, and relevant to my experience.
             """
+            if options:
+                prompt += (
+                    "Answer with exactly one of these options and nothing else: "
+                    + json.dumps(options)
+                )
 
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant creating job application responses.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-            )
-
-            return response.choices[0].message.content.strip()
+            answer = self._complete(prompt, model)
+            if options:
+                answer = match_option(answer, options) or ""
+            self._store(cache_key, question, answer)
+            return answer
         except Exception as e:
             self.logger.error(f"Error generating GPT response: {str(e)}")
             return ""
+
+    @metrics.timed("gpt.generate_batch_responses")
+    def generate_batch_responses(
+        self, fields: List[Dict], context: str = ""
+    ) -> Dict[str, str]:
+        """Answer every field of a form step with a single completion.
+
+        Each field is a dict with an ``id`` and a ``label`` and optionally a
+        list of ``options`` and a ``long`` flag for free-text answers that need
+        the main model. Returns a mapping from field id to answer. Free text
+        fields the batch answer leaves out or gets wrong fall back to
+        ``generate_response`` one at a time; choice fields are not asked twice
+        and are left empty.
+        """
+        answers = {}
+        pending = []
+        for field in fields:
+            cache_key, cached = self._lookup(
+                field["label"],
+                context,
+                field.get("options"),
+                self.client.model_for(field.get("long", False)),
+                field.get("long", False),
+            )
+            if cached is not None:
+                answers[field["id"]] = cached
+            else:
+                pending.append((field, cache_key))
+
+        if not pending:
+            return answers
+
+        batch = {}
+        if len(pending) > 1:
+            batch = self._request_batch([field for field, _ in pending], context)
+
+        for field, cache_key in pending:
+            answer = batch.get(field["id"])
+            if answer is None and field.get("options") and len(pending) > 1:
+                # At most one request per choice list: it already had its chance
+                answer = ""
+            elif answer is None:
+                answer = self.generate_response(
+                    field["label"],
+                    context,
+                    field.get("options"),
+                    field.get("long", False),
+                )
+            else:
+                self._store(cache_key, field["label"], answer)
+            answers[field["id"]] = answer
+
+        return answers
+
+    def _request_batch(self, fields: List[Dict], context: str) -> Dict[str, str]:
+        """Ask for all fields at once and return only the answers that validate"""
+        questions = []
+        for field in fields:
+            entry = {"id": field["id"], "question": field["label"]}
+            if field.get("options"):
+                entry["options"] = field["options"]
+            questions.append(entry)
+
+        resume = self.prompt_builder.resume_context(
+            " ".join(field["label"] for field in fields)
+        )
+        prompt = f"""
+            Based on my resume: {resume}
+
+            And this additional context: {context}
+
+            Please answer each of these job application questions:
+            {json.dumps(questions, indent=2)}
+
+            Keep each answer concise, professional, and relevant to my experience.
+            When a question lists options, answer with one of the options exactly.
+            Reply with only a JSON object mapping each question id to its answer.
+            """
+
+        # One long answer in the batch needs the main model for all of it
+        model = self.client.model_for(any(field.get("long") for field in fields))
+        try:
+            raw = self._complete(prompt, model)
+        except Exception as e:
+            self.logger.error(f"Error generating batched GPT response: {str(e)}")
+            return {}
+
+        valid = self._validate_batch(raw, fields)
+        if len(valid) < len(fields):
+            self.logger.warning(
+                f"Batched answer covered {len(valid)} of {len(fields)} fields, "
+                "falling back to per-field requests for the rest"
+            )
+        return valid
+
+    def _validate_batch(self, raw: str, fields: List[Dict]) -> Dict[str, str]:
+        # Models sometimes wrap JSON in a markdown code fence
+        match = re.search(r"\{.*\}", raw, re.DOTALL)
+        if not match:
+            self.logger.warning("Batched answer did not contain a JSON object")
+            return {}
+        try:
+            parsed = json.loads(match.group(0))
+        except ValueError as e:
+            self.logger.warning(f"Batched answer was not valid JSON: {str(e)}")
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+
+        valid = {}
+        for field in fields:
+            answer = parsed.get(field["id"])
+            if isinstance(answer, (int, float)) and not isinstance(answer, bool):
+                answer = str(answer)
+            if not isinstance(answer, str) or not answer.strip():
+                continue
+            answer = answer.strip()
+            options = field.get("options")
+            if options:
+                answer = match_option(answer, options)
+                if answer is None:
+                    continue
+            valid[field["id"]] = answer
+        return valid
+
+    def cache_stats(self) -> Dict:
+        """Hit/miss counters of the answer cache, empty when caching is disabled"""
+        if self.cache is None:
+            return {}
+        return self.cache.stats()
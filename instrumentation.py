@@ -0,0 +1,204 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+
+class _NullSpan:
+    """Shared no-op span handed out while metrics are disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, key, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    def __init__(self, metrics: "Metrics", name: str, attrs: Dict):
+        self.metrics = metrics
+        self.name = name
+        self.attrs = attrs
+        self.parent = None
+        self.started = 0.0
+
+    def set(self, key, value):
+        """Attach an attribute, e.g. token counts known only at the end"""
+        self.attrs[key] = value
+
+    def __enter__(self):
+        stack = self.metrics._stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.started
+        stack = self.metrics._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        record = {
+            "type": "span",
+            "name": self.name,
+            "ts": time.time(),
+            "duration": round(duration, 6),
+        }
+        if self.parent:
+            record["parent"] = self.parent
+        if self.attrs:
+            record["attrs"] = self.attrs
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        self.metrics._observe(self.name, duration)
+        self.metrics._write(record)
+        return False
+
+
+class Metrics:
+    """Timing spans, counters and histograms written as JSON lines.
+
+    Disabled by default; while disabled every call returns immediately so
+    the instrumented hot paths pay only an attribute check.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.enabled = False
+        self.path = None
+        self.counters = defaultdict(float)
+        self.histograms = defaultdict(list)
+        self._file = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def configure(self, enabled: bool = True, path: str = "logs/metrics.jsonl"):
+        self.close()
+        self.enabled = enabled
+        self.path = path
+        self.counters.clear()
+        self.histograms.clear()
+        if enabled and path:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._file = open(path, "a", encoding="utf-8")
+
+    def span(self, name: str, **attrs):
+        """Context manager timing the enclosed block"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+
+    def timed(self, name: Optional[str] = None):
+        """Decorator form of span(); the name defaults to the function's qualname"""
+
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name, {}):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def incr(self, name: str, value: float = 1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += value
+
+    def observe(self, name: str, value: float):
+        """Record one sample of a histogram, e.g. tokens per request"""
+        if self.enabled:
+            self._observe(name, value)
+            self._write(
+                {"type": "value", "name": name, "ts": time.time(), "value": value}
+            )
+
+    def summary(self) -> List[Dict]:
+        rows = []
+        with self._lock:
+            histograms = {
+                name: sorted(values) for name, values in self.histograms.items()
+            }
+            counters = dict(self.counters)
+        for name, values in sorted(histograms.items()):
+            count = len(values)
+            rows.append(
+                {
+                    "name": name,
+                    "count": count,
+                    "total": sum(values),
+                    "mean": sum(values) / count,
+                    "p50": values[count // 2],
+                    "p95": values[min(count - 1, int(count * 0.95))],
+                    "max": values[-1],
+                }
+            )
+        for name, value in sorted(counters.items()):
+            rows.append({"name": name, "count": value})
+        return rows
+
+    def format_summary(self) -> str:
+        lines = [
+            f"{'metric':<34}{'count':>8}{'total':>10}"
+            f"{'mean':>9}{'p50':>9}{'p95':>9}{'max':>9}"
+        ]
+        for row in self.summary():
+            if "total" not in row:
+                lines.append(f"{row['name']:<34}{row['count']:>8g}")
+                continue
+            lines.append(
+                f"{row['name']:<34}{row['count']:>8}{row['total']:>10.2f}"
+                f"{row['mean']:>9.3f}{row['p50']:>9.3f}"
+                f"{row['p95']:>9.3f}{row['max']:>9.3f}"
+            )
+        return "\n".join(lines)
+
+    def log_summary(self):
+        if self.enabled and (self.histograms or self.counters):
+            self.logger.info("Run metrics:\n" + self.format_summary())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                if self.counters:
+                    record = {"type": "counters", "ts": time.time()}
+                    record["counters"] = dict(self.counters)
+                    self._file.write(json.dumps(record) + "\n")
+                self._file.close()
+                self._file = None
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _observe(self, name, value):
+        with self._lock:
+            self.histograms[name].append(value)
+
+    def _write(self, record):
+        with self._lock:
+            if self._file is not None:
+                self._file.write(json.dumps(record, default=str) + "\n")
+
+
+# Process-wide instance used by the bot, the GPT handler and the resume parser
+metrics = Metrics()
@@ -0,0 +1,148 @@
+from typing import Dict, List, Optional
+
+
+TITLE_SELECTORS = [
+    "a.job-card-list__title",
+    "h3.job-card-list__title",
+    "a.disabled.ember-view.job-card-container__link.job-card-list__title",
+    ".job-card-container__link",
+    ".jobs-search-results__list-item-title",
+]
+
+# Turns every job card of a results page into a plain record in one round trip
+EXTRACT_JOB_CARDS_SCRIPT = """
+const [cards, titleSelectors] = arguments;
+const clean = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const first = (card, selectors) => {
+    for (const selector of selectors) {
+        const node = card.querySelector(selector);
+        if (node) return node;
+    }
+    return null;
+};
+
+return cards.map((card) => {
+    const idNode = card.closest('[data-job-id]') || card.querySelector('[data-job-id]');
+    const jobId = idNode ? idNode.getAttribute('data-job-id') : null;
+    const titleIndex = titleSelectors.findIndex((selector) => card.querySelector(selector));
+    const title = titleIndex >= 0 ? card.querySelector(titleSelectors[titleIndex]) : null;
+    const company = first(card, [
+        '.job-card-container__primary-description',
+        '.job-card-container__company-name',
+        '.artdeco-entity-lockup__subtitle',
+    ]);
+    const place = first(card, [
+        '.job-card-container__metadata-item',
+        '.artdeco-entity-lockup__caption',
+    ]);
+    const time = card.querySelector('time');
+    const link = (title && title.closest('a[href]')) || card.querySelector('a[href*="/jobs/view/"]');
+    let url = link ? link.href.split('?')[0] : '';
+    if (!url && jobId) url = `${location.origin}/jobs/view/${jobId}/`;
+
+    return {
+        job_id: jobId,
+        // Titles are often duplicated in a visually hidden span
+        title: title ? clean(title.innerText.split('\\n')[0]) : '',
+        company: company ? clean(company.innerText) : '',
+        location: place ? clean(place.innerText) : '',
+        url: url,
+        easy_apply: /easy apply/i.test(card.innerText),
+        posted: time ? (time.getAttribute('datetime') || clean(time.innerText)) : '',
+        // Which title selector matched, so the caller can learn which work
+        title_selector: titleIndex,
+    };
+});
+"""
+
+# Opens a job from the results list by id; returns false when it is not on the page
+OPEN_JOB_SCRIPT = """
+const [jobId, titleSelectors] = arguments;
+const card = document.querySelector(`[data-job-id="${CSS.escape(jobId)}"]`);
+if (!card) return false;
+let target = null;
+for (const selector of titleSelectors) {
+    target = card.querySelector(selector);
+    if (target) break;
+}
+target = target || card;
+target.scrollIntoView({block: 'center'});
+target.click();
+return true;
+"""
+
+
+class JobCard:
+    """Snapshot of one job card from a results page"""
+
+    __slots__ = (
+        "job_id",
+        "title",
+        "company",
+        "location",
+        "url",
+        "easy_apply",
+        "posted",
+        "score",
+        "query",
+    )
+
+    def __init__(
+        self,
+        job_id: Optional[str],
+        title: str = "",
+        company: str = "",
+        location: str = "",
+        url: str = "",
+        easy_apply: bool = False,
+        posted: str = "",
+        score: Optional[float] = None,
+        query: Optional[str] = None,
+    ):
+        self.job_id = job_id
+        self.title = title
+        self.company = company
+        self.location = location
+        self.url = url
+        self.easy_apply = easy_apply
+        self.posted = posted
+        # Relevance to the resume, filled in by JobScorer
+        self.score = score
+        # Label of the search that found the job
+        self.query = query
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "JobCard":
+        return cls(**{name: data.get(name) for name in cls.__slots__})
+
+    def as_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"JobCard({self.job_id!r}, {self.title!r}, {self.company!r})"
+
+
+def extract_job_cards(
+    driver, card_elements, title_selectors=TITLE_SELECTORS, registry=None
+) -> List[JobCard]:
+    """Snapshot card elements into JobCard records with a single script call.
+
+    With a SelectorRegistry, title_selectors are tried in its ranked order and
+    the selectors that matched are recorded under the "job_title" role.
+    """
+    if not card_elements:
+        return []
+    if registry is not None:
+        title_selectors = registry.rank("job_title", title_selectors)
+    rows = driver.execute_script(
+        EXTRACT_JOB_CARDS_SCRIPT, card_elements, title_selectors
+    ) or []
+    if registry is not None and rows:
+        hits = {row.get("title_selector", -1) for row in rows} - {-1}
+        # Selectors ranked below every hit were never tried, so they are not
+        # counted as misses
+        tried = title_selectors[: max(hits) + 1] if hits else title_selectors
+        registry.record(
+            "job_title", tried, [title_selectors[index] for index in hits]
+        )
+    return [JobCard.from_dict(row) for row in rows]
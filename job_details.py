@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from instrumentation import metrics
+from prompt_builder import truncate_tokens
+
+# Reads the open job's details pane in one round trip. Returns null while the
+# pane still shows another job, so a stale pane is never stored under this id.
+EXTRACT_JOB_DETAILS_SCRIPT = """
+const jobId = arguments[0];
+const clean = (text) => (text || '').replace(/[ \\t]+/g, ' ').replace(/\\n\\s*\\n+/g, '\\n').trim();
+const first = (selectors) => {
+    for (const selector of selectors) {
+        const node = document.querySelector(selector);
+        if (node && clean(node.innerText)) return node;
+    }
+    return null;
+};
+
+const pane = document.querySelector('.jobs-details[data-job-id], .jobs-search__job-details--container [data-job-id]');
+if (jobId && pane && pane.getAttribute('data-job-id') !== String(jobId)) return null;
+
+const description = first([
+    '#job-details',
+    '.jobs-description__content',
+    '.jobs-description-content__text',
+    '.jobs-box__html-content',
+]);
+if (!description) return null;
+const text = (selectors) => {
+    const node = first(selectors);
+    return node ? clean(node.innerText) : '';
+};
+
+return {
+    title: text(['.job-details-jobs-unified-top-card__job-title', '.jobs-unified-top-card__job-title', 'h1', 'h2']),
+    company: text(['.job-details-jobs-unified-top-card__company-name', '.jobs-unified-top-card__company-name']),
+    location: text([
+        '.job-details-jobs-unified-top-card__primary-description-container',
+        '.jobs-unified-top-card__bullet',
+    ]).split('·')[0].trim(),
+    description: clean(description.innerText),
+    requirements: Array.from(description.querySelectorAll('li'))
+        .map((item) => clean(item.innerText))
+        .filter(Boolean)
+        .slice(0, 30),
+    insights: Array.from(document.querySelectorAll(
+        '.job-details-jobs-unified-top-card__job-insight, .jobs-unified-top-card__job-insight'
+    )).map((item) => clean(item.innerText)).filter(Boolean),
+};
+"""
+
+
+def build_digest(details: Dict, max_tokens: int = 200) -> str:
+    """Compact job summary for prompts: headline, requirements, then description"""
+    headline = f"Job: {details.get('title', '')}"
+    if details.get("company"):
+        headline += f" at {details['company']}"
+    if details.get("location"):
+        headline += f" ({details['location']})"
+    parts = [headline]
+    if details.get("insights"):
+        parts.append("; ".join(details["insights"]))
+    if details.get("requirements"):
+        parts.append("Requirements: " + "; ".join(details["requirements"]))
+    if details.get("description"):
+        parts.append("Description: " + " ".join(details["description"].split()))
+    return truncate_tokens("\n".join(parts), max_tokens)
+
+
+class JobDetailsStore:
+    """Job details by job id: SQLite on disk with an in-memory LRU in front"""
+
+    def __init__(
+        self,
+        path: str = "cache/job_details.sqlite3",
+        max_memory_entries: int = 256,
+        digest_tokens: int = 200,
+    ):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.path = path
+        self.max_memory_entries = max_memory_entries
+        self.digest_tokens = digest_tokens
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_details (
+                job_id TEXT PRIMARY KEY,
+                details TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                captured_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, job_id: Optional[str]) -> Optional[Dict]:
+        if not job_id:
+            return None
+        with self._lock:
+            record = self._memory.get(job_id)
+            if record is not None:
+                self._memory.move_to_end(job_id)
+                return record
+            row = self._conn.execute(
+                "SELECT details, digest FROM job_details WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        record["digest"] = row[1]
+        self._remember(job_id, record)
+        return record
+
+    def put(self, job_id: str, details: Dict) -> Dict:
+        record = dict(details, digest=build_digest(details, self.digest_tokens))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_details "
+                "(job_id, details, digest, captured_at) VALUES (?, ?, ?, ?)",
+                (job_id, json.dumps(details), record["digest"], time.time()),
+            )
+            self._conn.commit()
+        self._remember(job_id, record)
+        return record
+
+    def capture(self, driver, job) -> Optional[Dict]:
+        """Details of the open job, scraped only the first time it is seen"""
+        record = self.get(job.job_id)
+        if record is not None:
+            metrics.incr("job_details.cached")
+            return record
+        try:
+            details = driver.execute_script(EXTRACT_JOB_DETAILS_SCRIPT, job.job_id)
+        except Exception as e:
+            self.logger.debug("Could not read job details: %s", e)
+            return None
+        if not details:
+            return None
+        metrics.incr("job_details.scraped")
+        # The card is the more reliable source for what it shows
+        for key in ("title", "company", "location"):
+            details[key] = getattr(job, key, "") or details.get(key, "")
+        if not job.job_id:
+            return dict(details, digest=build_digest(details, self.digest_tokens))
+        return self.put(job.job_id, details)
+
+    def descriptions(self, job_ids: Iterable[Optional[str]]) -> Dict[str, str]:
+        """Known description text for those of job_ids already captured"""
+        ids = [job_id for job_id in job_ids if job_id]
+        if not ids:
+            return {}
+        found = {}
+        with self._lock:
+            for job_id in ids:
+                if job_id in self._memory:
+                    found[job_id] = self._memory[job_id].get("description", "")
+            missing = [job_id for job_id in ids if job_id not in found]
+            if missing:
+                placeholders = ", ".join("?" for _ in missing)
+                rows = self._conn.execute(
+                    f"SELECT job_id, details FROM job_details "
+                    f"WHERE job_id IN ({placeholders})",
+                    missing,
+                ).fetchall()
+                for job_id, details in rows:
+                    found[job_id] = json.loads(details).get("description", "")
+        return found
+
+    def _remember(self, job_id: str, record: Dict):
+        with self._lock:
+            self._memory[job_id] = record
+            self._memory.move_to_end(job_id)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
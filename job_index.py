@@ -0,0 +1,88 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+SEEN = "seen"
+NON_EASY_APPLY = "non_easy_apply"
+APPLIED = "applied"
+FAILED = "failed"
+
+# Jobs in these states are never opened again
+SKIP_STATUSES = (APPLIED, NON_EASY_APPLY)
+
+
+class JobIndex:
+    """SQLite index of processed job ids with an in-memory set in front"""
+
+    def __init__(self, path: str = "cache/jobs.sqlite3"):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                reason TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        placeholders = ", ".join("?" for _ in SKIP_STATUSES)
+        self._skip = {
+            row[0]
+            for row in self._conn.execute(
+                f"SELECT job_id FROM jobs WHERE status IN ({placeholders})",
+                SKIP_STATUSES,
+            )
+        }
+        self.logger.debug(f"Loaded {len(self._skip)} processed jobs from index")
+
+    def should_skip(self, job_id: Optional[str]) -> bool:
+        return bool(job_id) and job_id in self._skip
+
+    def mark(self, job_id: Optional[str], status: str, reason: str = ""):
+        if not job_id:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, reason, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (job_id, status, reason, time.time()),
+            )
+            self._conn.commit()
+            if status in SKIP_STATUSES:
+                self._skip.add(job_id)
+            else:
+                self._skip.discard(job_id)
+
+    def status(self, job_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def count_since(self, status: str, since: float) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ? AND updated_at >= ?",
+                (status, since),
+            ).fetchone()
+        return row[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,154 @@
+import logging
+import os
+import zlib
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from answer_cache import fingerprint
+from instrumentation import metrics
+from resume_parser import keywords
+
+# Hashed feature space; large enough that unrelated terms rarely collide
+FEATURE_BITS = 18
+# Bump when the features change so cached resume vectors are rebuilt
+VECTOR_VERSION = 1
+
+
+def terms(text: str) -> List[str]:
+    """Unigrams plus bigrams, so "data engineer" outweighs the two words apart"""
+    words = keywords(text)
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def hashed_terms(text: str) -> List[int]:
+    mask = (1 << FEATURE_BITS) - 1
+    return [zlib.crc32(term.encode("utf-8")) & mask for term in terms(text)]
+
+
+class JobScorer:
+    """Scores job postings against the resume with hashed term vectors.
+
+    The resume vector is built once and cached on disk by resume fingerprint.
+    A batch of postings is scored with a handful of NumPy operations, without
+    building a dense matrix.
+    """
+
+    def __init__(
+        self,
+        resume_parser,
+        min_score: Optional[float] = None,
+        cache_dir: Optional[str] = "cache",
+    ):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.min_score = min_score
+        self.pruned = 0
+        self.resume_vector = self._load_resume_vector(resume_parser, cache_dir)
+
+    def _load_resume_vector(self, resume_parser, cache_dir) -> np.ndarray:
+        key = fingerprint(f"{VECTOR_VERSION}:{resume_parser.get_resume_content()}")
+        path = None
+        if cache_dir:
+            path = os.path.join(cache_dir, f"resume_vector_{key}.npy")
+        if path and os.path.exists(path):
+            try:
+                return np.load(path)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable resume vector: {str(e)}")
+
+        vector = self._resume_vector(resume_parser)
+        if path:
+            try:
+                if not os.path.exists(cache_dir):
+                    os.makedirs(cache_dir)
+                tmp_path = f"{path}.tmp.npy"
+                np.save(tmp_path, vector)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                self.logger.warning(f"Could not cache resume vector: {str(e)}")
+        return vector
+
+    @staticmethod
+    def _resume_vector(resume_parser) -> np.ndarray:
+        vector = np.zeros(1 << FEATURE_BITS, dtype=np.float32)
+        np.add.at(vector, hashed_terms(resume_parser.get_resume_content()), 1.0)
+        # Titles, skills and the summary say more about fit than bullet points
+        headline = "\n".join(
+            [resume_parser.get_section("summary"), " ".join(resume_parser.skills)]
+            + [entry["title"] for entry in resume_parser.experience]
+        )
+        np.add.at(vector, hashed_terms(headline), 2.0)
+        vector = np.log1p(vector)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def score_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """Cosine similarity of each text to the resume, in one batch"""
+        rows = []
+        columns = []
+        for row, text in enumerate(texts):
+            hashed = hashed_terms(text)
+            rows.extend([row] * len(hashed))
+            columns.extend(hashed)
+        if not columns:
+            return np.zeros(len(texts), dtype=np.float32)
+
+        # Count each (row, term) pair once, then weight it like the resume side
+        cells, counts = np.unique(
+            np.array(rows, dtype=np.int64) << FEATURE_BITS | np.array(columns),
+            return_counts=True,
+        )
+        cell_rows = cells >> FEATURE_BITS
+        cell_columns = cells & ((1 << FEATURE_BITS) - 1)
+        weights = np.log1p(counts)
+        norms = np.sqrt(
+            np.bincount(cell_rows, weights=weights**2, minlength=len(texts))
+        )
+        dots = np.bincount(
+            cell_rows,
+            weights=weights * self.resume_vector[cell_columns],
+            minlength=len(texts),
+        )
+        norms[norms == 0] = 1
+        return dots / norms
+
+    def rank(self, jobs: List, details: Optional[Dict[str, str]] = None) -> List:
+        """Jobs sorted best match first, dropping those at or below min_score.
+
+        Nothing is dropped when min_score is None, and cards without a title
+        are always kept: a missing title means extraction failed, not a poor
+        match. details optionally maps job id to description text known for
+        the job.
+        """
+        if not jobs:
+            return []
+        details = details or {}
+        # The title is counted twice: on a card it is most of the signal
+        texts = [
+            " ".join(
+                [
+                    job.title or "",
+                    job.title or "",
+                    job.company or "",
+                    details.get(job.job_id, ""),
+                ]
+            )
+            for job in jobs
+        ]
+        for job, score in zip(jobs, self.score_texts(texts)):
+            job.score = float(score)
+        kept = [
+            job
+            for job in jobs
+            if self.min_score is None
+            or job.score > self.min_score
+            or not (job.title or "").strip()
+        ]
+        self.pruned += len(jobs) - len(kept)
+        metrics.incr("search.jobs_pruned", len(jobs) - len(kept))
+        if len(kept) < len(jobs):
+            self.logger.info(
+                f"Skipping {len(jobs) - len(kept)} jobs scoring at or below "
+                f"{self.min_score} against the resume"
+            )
+        return sorted(kept, key=lambda job: -job.score)
@@ -2,51 +2,214 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 import json
 import os
-from time import sleep
+from urllib.parse import quote
 from dotenv import load_dotenv
 from logger_config import setup_logger
+from instrumentation import metrics
 from gpt_handler import GPTHandler
+from llm_client import LLMClient
+from answer_cache import AnswerCache
+from answer_bank import AnswerBank
+from answer_prefetcher import AnswerPrefetcher, DEFAULT_LIKELY_QUESTIONS
+from selector_registry import SelectorRegistry
+from job_index import JobIndex, APPLIED, FAILED, NON_EASY_APPLY, SEEN
+from job_cards import JobCard, OPEN_JOB_SCRIPT, TITLE_SELECTORS, extract_job_cards
+from job_details import JobDetailsStore
+from job_scoring import JobScorer
 from resume_parser import ResumeParser
-import time
+import form_filler
+import form_steps
+from pacing import PacingScheduler
+from driver_cache import DriverCache
+from session_store import SessionStore
+import session_journal
+from session_journal import SessionJournal
 import random
-from datetime import datetime, timedelta
 
 
 class LinkedInBot:
-    def __init__(self):
-        self.logger = setup_logger()
-        self.logger.info("Initializing LinkedIn Bot")
+    JOBS_PER_PAGE = 25
+    # Guards against forms that never advance, e.g. an unanswered required field
+    MAX_FORM_STEPS = 10
+
+    def __init__(self, config_path="config.json", clock=None):
         load_dotenv()
-        with open("config.json") as f:
+        with open(config_path) as f:
             self.config = json.load(f)
+        self.logger = setup_logger(
+            level=self.config.get("log_level", "DEBUG"),
+            async_logging=self.config.get("log_async", True),
+            json_format=self.config.get("log_json", False),
+            max_bytes=self.config.get("log_max_bytes", 5 * 1024 * 1024),
+            backup_count=self.config.get("log_backup_count", 5),
+        )
+        self.logger.info("Initializing LinkedIn Bot")
+        metrics.configure(
+            enabled=self.config.get("metrics_enabled", True),
+            path=self.config.get("metrics_path", "logs/metrics.jsonl"),
+        )
+        self.base_url = self.config.get("base_url", "https://www.linkedin.com")
+        self.job_index = JobIndex(
+            self.config.get("job_index_path", "cache/jobs.sqlite3")
+        )
+        self.job_details = JobDetailsStore(
+            self.config.get("job_details_path", "cache/job_details.sqlite3"),
+            digest_tokens=self.config.get("job_context_tokens", 200),
+        )
+        # Digest of the job being applied to, sent with every GPT question
+        self.job_context = ""
+        self.journal = SessionJournal(
+            self.config.get("journal_path", "cache/journal.jsonl")
+        )
+        self.recover_interrupted_job()
+        self.daily_application_limit = self.config.get("daily_application_limit", 15)
+        # Optional cap on applications per search, so one broad search cannot
+        # use the whole day; unset, every search may use what is left
+        self.query_quota = self.config.get("per_query_limit")
+        self.applied_by_query = Counter()
+        start_of_day = datetime.combine(date.today(), datetime.min.time()).timestamp()
+        self.applications_today = self.job_index.count_since(APPLIED, start_of_day)
+        if self.journal.resumable():
+            self.applications_today = max(
+                self.applications_today, self.journal.state["applied"]
+            )
+        self.scheduler = PacingScheduler(
+            clock=clock,
+            applications_per_day=self.daily_application_limit,
+            applications_done=self.applications_today,
+            gpt_calls_per_minute=self.config.get("gpt_calls_per_minute", 20),
+            page_loads_per_minute=self.config.get("page_loads_per_minute", 10),
+            session_seconds=self.config.get("session_hours", 4) * 3600,
+        )
+        self.last_action_time = self.scheduler.clock.now()
+
+        self.driver = None
+        if not self.scheduler.has_budget("applications"):
+            self.logger.info(
+                f"Already applied to {self.applications_today} jobs today, "
+                "not starting the browser"
+            )
+            return
+
+        self.session_store = SessionStore(
+            self.config.get("session_path", "cache/session.json"),
+            max_age_days=self.config.get("session_max_age_days", 14),
+        )
+        self.driver_cache = DriverCache(
+            self.config.get("driver_cache_path", "cache/driver.json"),
+            max_age_days=self.config.get("driver_cache_days", 7),
+        )
+
+        # Settings whose absence would only surface after a browser launch and
+        # a login attempt are checked before starting either
+        for key in ("resume_path", "openai_api_key"):
+            if not self.config.get(key):
+                raise ValueError(f"Missing required setting: {key}")
+        if not os.path.exists(self.config["resume_path"]):
+            raise FileNotFoundError(f"Resume not found: {self.config['resume_path']}")
+
+        # Browser launch and login dominate startup, so overlap them with the
+        # resume parsing and local setup
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup") as pool:
+            browser_ready = pool.submit(self.start_browser)
+            try:
+                self.setup_components()
+            except Exception:
+                # Don't leave the browser running behind a failed startup
+                try:
+                    browser_ready.result()
+                except Exception:
+                    pass
+                if self.driver is not None:
+                    self.driver.quit()
+                raise
+            browser_ready.result()
+
+    def setup_components(self):
+        """Resume, answer sources and caches; runs while the browser starts"""
         resume_parser = ResumeParser(self.config["resume_path"])
-        self.gpt_handler = GPTHandler(
+        self.answer_cache = AnswerCache(
+            path=self.config.get("answer_cache_path", "cache/answers.sqlite3"),
+            ttl_seconds=self.config.get("answer_cache_ttl_days", 30) * 24 * 3600,
+        )
+        # One pooled client shared by form filling and the prefetch workers
+        self.llm_client = LLMClient(
             api_key=self.config["openai_api_key"],
+            base_url=self.config.get("openai_api_base"),
+            model=self.config.get("gpt_model", "gpt-4"),
+            fast_model=self.config.get("gpt_fast_model"),
+            timeout=self.config.get("gpt_timeout", 30),
+            max_retries=self.config.get("gpt_max_retries", 4),
+            max_connections=self.config.get("gpt_max_concurrency", 2) + 1,
+            stream=self.config.get("gpt_stream", False),
+        )
+        self.gpt_handler = GPTHandler(
+            client=self.llm_client,
             resume_content=resume_parser.get_resume_content(),
+            cache=self.answer_cache,
+            rate_limiter=lambda: self.scheduler.acquire("gpt_calls"),
+            resume_sections=resume_parser.sections,
+            prompt_token_budget=self.config.get("prompt_token_budget", 600),
+        )
+        self.answer_bank = AnswerBank(
+            resume_parser,
+            answers=self.config.get("answers"),
+            custom_patterns=self.config.get("answer_patterns"),
+        )
+        # Only questions the answer bank cannot answer are worth prefetching
+        self.likely_questions = [
+            label
+            for label in self.config.get(
+                "likely_questions", DEFAULT_LIKELY_QUESTIONS
+            )
+            if self.answer_bank.resolve(label) is None
+        ]
+        self.answer_prefetcher = AnswerPrefetcher(
+            self.gpt_handler,
+            max_workers=self.config.get("gpt_max_concurrency", 2),
         )
-        self.daily_application_limit = 15
-        self.applications_today = 0
-        self.last_action_time = datetime.now()
-        self.session_start_time = datetime.now()
+        self.job_scorer = JobScorer(
+            resume_parser,
+            min_score=self.config.get("min_job_score"),
+            cache_dir=self.config.get("job_scoring_cache_dir", "cache"),
+        )
+        self.selectors = SelectorRegistry(
+            self.config.get("selector_stats_path", "cache/selector_stats.json")
+        )
+
+    def start_browser(self):
         self.setup_driver()
         self.login()
 
     def random_delay(self, min_seconds=2, max_seconds=5):
         """Add random delay between actions"""
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
+        self.scheduler.delay(min_seconds, max_seconds)
 
     def setup_driver(self):
-        self.logger.info("Setting up Edge WebDriver")
-        options = webdriver.EdgeOptions()
+        browser = self.config.get("browser", "edge")
+        self.logger.info(f"Setting up {browser.title()} WebDriver")
+        if browser == "chrome":
+            options = webdriver.ChromeOptions()
+        else:
+            options = webdriver.EdgeOptions()
+        if self.config.get("headless"):
+            options.add_argument("--headless=new")
         options.add_argument("--disable-notifications")
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--disable-infobars")
         options.add_argument("--start-maximized")
+        if self.config.get("browser_profile_dir"):
+            # A persistent profile keeps cookies and storage without the session file
+            profile_dir = os.path.abspath(self.config["browser_profile_dir"])
+            options.add_argument(f"--user-data-dir={profile_dir}")
 
         # Add random user agent
         user_agents = [
@@ -55,23 +218,60 @@ class LinkedInBot:
         ]
         options.add_argument(f"user-agent={random.choice(user_agents)}")
 
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        self.driver = webdriver.Edge(service=service, options=options)
+        driver_path = self.resolve_driver_path(browser)
+        try:
+            self.driver = self.launch_browser(browser, options, driver_path)
+        except Exception as e:
+            if not driver_path or self.config.get("driver_path"):
+                raise
+            # A cached driver goes stale when the browser updates itself
+            self.logger.warning(f"Cached driver failed to start, re-resolving: {e}")
+            self.driver_cache.invalidate(browser)
+            driver_path = self.resolve_driver_path(browser)
+            self.driver = self.launch_browser(browser, options, driver_path)
+
+        # Remember whatever binary actually started so the next run skips resolution
+        if self.driver_cache.get(browser) != self.driver.service.path:
+            self.driver_cache.store(browser, self.driver.service.path)
         self.logger.debug("WebDriver setup complete")
 
+    def resolve_driver_path(self, browser):
+        """Driver binary to launch: pinned in config, cached, or freshly resolved"""
+        if self.config.get("driver_path"):
+            return self.config["driver_path"]
+        cached = self.driver_cache.get(browser)
+        if cached:
+            self.logger.debug("Using cached driver: %s", cached)
+            return cached
+        if browser == "chrome":
+            # Selenium Manager resolves chromedriver, or finds it on PATH offline
+            return None
+
+        # Imported here: webdriver_manager is slow to import and hits the network
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+        return EdgeChromiumDriverManager().install()
+
+    def launch_browser(self, browser, options, driver_path):
+        if browser == "chrome":
+            service = ChromeService(executable_path=driver_path)
+            return webdriver.Chrome(service=service, options=options)
+        service = EdgeService(executable_path=driver_path)
+        return webdriver.Edge(service=service, options=options)
+
     def should_continue(self):
         """Check if we should continue applying"""
-        if self.applications_today >= self.daily_application_limit:
+        if not self.scheduler.has_budget("applications"):
             self.logger.info("Daily application limit reached")
             return False
 
         # Add cooldown between actions
-        time_since_last_action = datetime.now() - self.last_action_time
-        if time_since_last_action.seconds < random.uniform(30, 60):
+        time_since_last_action = self.scheduler.clock.now() - self.last_action_time
+        if time_since_last_action < random.uniform(30, 60):
             self.random_delay(5, 10)
 
-        # Add session length limit (4 hours)
-        if datetime.now() - self.session_start_time > timedelta(hours=4):
+        # Add session length limit (4 hours by default)
+        if self.scheduler.session_expired():
             self.logger.info("Session time limit reached")
             return False
 
@@ -91,9 +291,44 @@ class LinkedInBot:
             self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
             self.random_delay(0.5, 1.5)
 
+    def is_logged_in(self, driver=None):
+        """True once the page shows the signed-in navigation bar"""
+        return (driver or self.driver).execute_script(
+            "return !!document.querySelector('#global-nav, nav.global-nav') && "
+            "!/^\\/(login|checkpoint|uas)/.test(location.pathname);"
+        )
+
+    def resume_session(self):
+        """Reuse a saved session; returns False when a full login is needed"""
+        session = self.session_store.load()
+        restored = session is not None and self.session_store.restore_cookies(
+            self.driver, session, self.base_url
+        )
+        if not restored and not self.config.get("browser_profile_dir"):
+            return False
+
+        self.scheduler.acquire("page_loads")
+        self.driver.get(f"{self.base_url}/feed/")
+        try:
+            WebDriverWait(self.driver, 10).until(self.is_logged_in)
+        except TimeoutException:
+            self.logger.info("Saved session is no longer valid, logging in again")
+            self.session_store.clear()
+            self.driver.delete_all_cookies()
+            return False
+
+        if session is not None:
+            self.session_store.restore_local_storage(self.driver, session)
+        self.logger.info("Resumed saved LinkedIn session")
+        return True
+
     def login(self):
+        if self.resume_session():
+            return
+
         self.logger.info("Attempting to log in to LinkedIn")
-        self.driver.get("https://www.linkedin.com/login")
+        self.scheduler.acquire("page_loads")
+        self.driver.get(f"{self.base_url}/login")
 
         # Wait for and fill in email
         email_field = WebDriverWait(self.driver, 10).until(
@@ -114,9 +349,46 @@ class LinkedInBot:
         login_button.click()
         self.logger.info("Login form submitted")
 
-        sleep(5)
+        # Wait for the signed-in page rather than a fixed pause; a security
+        # checkpoint can take a while if it has to be solved by hand
+        try:
+            WebDriverWait(self.driver, self.config.get("login_timeout", 60)).until(
+                self.is_logged_in
+            )
+        except TimeoutException:
+            self.logger.warning("Did not reach the signed-in page after login")
+            return
+
+        self.session_store.save(self.driver)
         self.logger.info("Login completed")
 
+    def recover_interrupted_job(self):
+        """Settle the job the previous run was working on when it stopped"""
+        job = self.journal.interrupted()
+        if job is None:
+            return
+        job_id = job["job_id"]
+        if job["submitted"]:
+            # The submit click may have gone out; applying again risks a duplicate
+            self.logger.info(f"Job {job_id} was submitted before the last run stopped")
+            outcome = APPLIED
+            self.job_index.mark(job_id, APPLIED)
+        elif job["attempts"] >= self.config.get("journal_max_attempts", 2):
+            # Whatever stopped the run twice on this job will likely do it again
+            self.logger.warning(
+                f"Giving up on job {job_id} after {job['attempts']} "
+                "interrupted attempts"
+            )
+            outcome = FAILED
+            self.job_index.mark(job_id, FAILED, "interrupted repeatedly")
+        else:
+            self.logger.info(
+                f"Retrying job {job_id}, interrupted at form step {job['step']}"
+            )
+            return
+        self.journal.record(session_journal.FINISHED, job_id=job_id, outcome=outcome)
+
+    @metrics.timed("search.wait_for_jobs")
     def wait_for_jobs_to_load(self, max_retries=3):
         """Wait for job listings to become visible with retries"""
         retry_count = 0
@@ -126,24 +398,24 @@ class LinkedInBot:
                     f"Waiting for job listings to load (attempt {retry_count + 1})..."
                 )
 
-                # Wait for jobs container with multiple possible selectors
-                for selector in [
-                    "div.jobs-search-results-list",
-                    "ul.jobs-search-results__list",
-                    "div.scaffold-layout__list-container",
-                    "div.jobs-search__results-list",
-                ]:
-                    try:
-                        element = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        if element.is_displayed():
-                            self.logger.info(
-                                f"Found visible jobs container with selector: {selector}"
-                            )
-                            return True
-                    except:
-                        continue
+                # Race all known container selectors in a single wait
+                selector, _ = self.selectors.find(
+                    self.driver,
+                    "jobs_container",
+                    [
+                        "div.jobs-search-results-list",
+                        "ul.jobs-search-results__list",
+                        "div.scaffold-layout__list-container",
+                        "div.jobs-search__results-list",
+                    ],
+                    timeout=10,
+                    serial_timeout=10,
+                )
+                if selector:
+                    self.logger.info(
+                        f"Found visible jobs container with selector: {selector}"
+                    )
+                    return True
 
                 # If no selectors worked, try scrolling and waiting
                 self.logger.info("Scrolling page to trigger job loading...")
@@ -162,240 +434,343 @@ class LinkedInBot:
 
         return False
 
-    def search_jobs(self):
-        self.logger.info(
-            f"Searching jobs for: {self.config['job_title']} in {self.config['location']}"
-        )
-
-        # Construct search URL with better filtering
-        search_url = (
-            "https://www.linkedin.com/jobs/search/?"
-            + f"keywords={self.config['job_title']}&"
-            + f"location={self.config['location']}&"
+    def search_queries(self):
+        """(keywords, location) pairs to search; both settings may be lists"""
+        titles = self.config["job_title"]
+        locations = self.config["location"]
+        if isinstance(titles, str):
+            titles = [titles]
+        if isinstance(locations, str):
+            locations = [locations]
+        return [(title, location) for title in titles for location in locations]
+
+    @staticmethod
+    def query_label(query):
+        return f"{query[0]} in {query[1]}"
+
+    def query_quota_reached(self, label):
+        """True once the search labelled label has used its application quota"""
+        if label is None or not self.query_quota:
+            return False
+        return self.applied_by_query[label] >= self.query_quota
+
+    def build_search_url(self, page, keywords, location):
+        """Search URL for one page of results (25 jobs per page)"""
+        return (
+            f"{self.base_url}/jobs/search/?"
+            + f"keywords={quote(keywords)}&"
+            + f"location={quote(location)}&"
             + "f_AL=true&"  # Easy Apply filter
             + "f_WT=2&"  # Full-time
             + "sortBy=DD&"  # Most recent
             + "position=1&"
-            + "pageNum=0&"
+            + f"pageNum={page}&"
+            + f"start={page * self.JOBS_PER_PAGE}&"
             + "f_TPR=r86400"  # Last 24 hours
         )
 
-        self.driver.get(search_url)
+    def job_queue(self):
+        """Yield the jobs to process, continuing an interrupted session if any"""
+        if not self.journal.resumable():
+            self.journal.start()
+            yield from self.search_jobs()
+            return
+
+        self.applied_by_query.update(self.journal.applied_by_query())
+        pending = [
+            JobCard.from_dict(job)
+            for job in self.journal.pending_jobs()
+            if not self.job_index.should_skip(job.get("job_id"))
+        ]
+        self.logger.info(
+            f"Resuming the interrupted session with {len(pending)} queued jobs"
+        )
+        yield from pending
+        if not self.journal.state["search_done"]:
+            yield from self.search_jobs(
+                self.journal.state["next_page"],
+                self.journal.state["queries_done"],
+                {job.get("job_id") for job in self.journal.state["queue"]},
+            )
+
+    def search_jobs(self, next_pages=None, finished=(), yielded=None):
+        """Yield JobCard records from every search, loading pages as they are consumed.
+
+        The searches take turns, one results page each, and their results are
+        merged into one stream in which every job appears once. A search stops
+        when its results run out or it reaches its application quota. Each
+        page's jobs are journaled before any of them is yielded.
+        """
+        queries = [
+            query
+            for query in self.search_queries()
+            if self.query_label(query) not in finished
+        ]
+        self.logger.info(
+            "Searching jobs for: "
+            + "; ".join(self.query_label(query) for query in queries)
+        )
+
+        max_pages = self.config.get("max_search_pages", 10)
+        next_pages = dict(next_pages or {})
+        yielded = set(yielded or ())
+        while queries:
+            for query in list(queries):
+                label = self.query_label(query)
+                page = next_pages.get(label, 0)
+                jobs = None
+                if self.query_quota_reached(label):
+                    self.logger.info(f"Search quota reached for {label}")
+                elif page < max_pages:
+                    with metrics.span("search.page", page=page, query=label) as span:
+                        jobs = self.load_search_page(page, *query)
+                        span.set("jobs", len(jobs) if jobs is not None else 0)
+                if jobs is None:
+                    queries.remove(query)
+                    self.journal.record(session_journal.QUERY_DONE, query=label)
+                    continue
+                next_pages[label] = page + 1
+                metrics.incr("search.jobs_found", len(jobs))
+
+                # Result pages overlap when new postings push others down, and
+                # searches overlap when a job matches more than one of them
+                fresh = []
+                for job in jobs:
+                    if job.job_id and job.job_id in yielded:
+                        continue
+                    yielded.add(job.job_id)
+                    job.query = label
+                    fresh.append(job)
+                self.journal.record(
+                    session_journal.PAGE,
+                    query=label,
+                    page=page,
+                    jobs=[job.as_dict() for job in fresh],
+                )
+                yield from fresh
+        self.journal.record(session_journal.SEARCH_DONE)
+
+    def load_search_page(self, page, keywords, location):
+        """Open one result page and return its unprocessed JobCard records.
+
+        Returns None when the page has no job cards at all, i.e. past the last page.
+        """
+        self.logger.info(
+            f"Loading search results page {page + 1} for {keywords} in {location}"
+        )
+        self.scheduler.acquire("page_loads")
+        self.driver.get(self.build_search_url(page, keywords, location))
         self.random_delay(5, 7)  # Increased initial wait time
 
         if not self.wait_for_jobs_to_load():
             self.logger.error("Failed to load job listings after multiple attempts")
-            return []
+            return None
 
         # Try to find jobs with various selectors
-        jobs = []
-        job_selectors = [
-            "div.job-card-container",
-            "li.jobs-search-results__list-item",
-            "div.job-card-list__entity-lockup",
-            "div[data-job-id]",
-        ]
+        selector, jobs = self.selectors.find(
+            self.driver,
+            "job_card",
+            [
+                "div.job-card-container",
+                "li.jobs-search-results__list-item",
+                "div.job-card-list__entity-lockup",
+                "div[data-job-id]",
+            ],
+            timeout=10,
+            visible=False,
+        )
+        if not jobs:
+            self.logger.info("No jobs found on this page")
+            return None
 
-        for selector in job_selectors:
-            try:
-                jobs = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if jobs:
-                    self.logger.info(
-                        f"Found {len(jobs)} jobs using selector: {selector}"
-                    )
-                    # Verify jobs are actually loaded
-                    try:
-                        for i, job in enumerate(jobs[:3], 1):  # Check first 3 jobs
-                            self.driver.execute_script(
-                                "arguments[0].scrollIntoView(true);", job
-                            )
-                            self.random_delay(1, 2)
-                            title = job.find_element(
-                                By.CSS_SELECTOR, "a.job-card-list__title"
-                            ).text
-                            self.logger.info(f"Verified job {i}: {title}")
-                        return jobs
-                    except Exception as e:
-                        self.logger.error(f"Error verifying jobs: {str(e)}")
-                        continue
-            except:
-                continue
+        self.logger.info(f"Found {len(jobs)} jobs using selector: {selector}")
 
-        self.logger.error("No valid jobs found with any selector")
-        return []
+        # Snapshot the cards so later steps never touch these elements again
+        cards = extract_job_cards(
+            self.driver, jobs, TITLE_SELECTORS, registry=self.selectors
+        )
 
-    def is_easy_apply(self):
-        """Check if current job has Easy Apply button"""
-        try:
-            # Updated selectors to match LinkedIn's button structure
-            button_selectors = [
+        # Drop jobs we already applied to or rejected in an earlier run
+        jobs = [card for card in cards if not self.job_index.should_skip(card.job_id)]
+        self.logger.info(f"{len(jobs)} jobs not processed in earlier runs")
+
+        # Spend the daily budget on the best matches of the page first; jobs
+        # opened in an earlier run are scored on their description as well
+        jobs = self.job_scorer.rank(
+            jobs, self.job_details.descriptions(job.job_id for job in jobs)
+        )
+        if jobs:
+            self.logger.debug(
+                "Best match on page: %s (%.3f)", jobs[0].title, jobs[0].score
+            )
+        return jobs
+
+    def open_job(self, job):
+        """Open a job's details, from the results list if it is there, else by URL"""
+        opened = False
+        if job.job_id:
+            opened = self.driver.execute_script(
+                OPEN_JOB_SCRIPT,
+                job.job_id,
+                self.selectors.rank("job_title", TITLE_SELECTORS),
+            )
+        if not opened:
+            if not job.url:
+                return False
+            self.scheduler.acquire("page_loads")
+            self.driver.get(job.url)
+        return True
+
+    def find_easy_apply_button(self):
+        """Return the visible Easy Apply button of the current job, or None"""
+        # Updated selectors to match LinkedIn's button structure
+        return self.selectors.find_element(
+            self.driver,
+            "apply_button",
+            [
                 "button.jobs-apply-button.artdeco-button--3",
                 "button.jobs-apply-button.artdeco-button--primary",
                 "button[data-live-test-job-apply-button]",
                 "button.artdeco-button--primary[aria-label*='Easy Apply to']",
                 ".jobs-apply-button",  # Fallback
-            ]
-
-            for selector in button_selectors:
-                try:
-                    buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for button in buttons:
-                        if button.is_displayed():
-                            # Check either button text or aria-label
-                            button_text = button.text.lower()
-                            aria_label = button.get_attribute("aria-label", "").lower()
-                            if ("easy apply" in button_text) or (
-                                "easy apply to" in aria_label
-                            ):
-                                self.logger.info(
-                                    f"Found Easy Apply button: {aria_label}"
-                                )
-                                return True
-                except:
-                    continue
-            return False
-        except Exception as e:
-            self.logger.error(f"Error checking Easy Apply button: {str(e)}")
-            return False
+            ],
+            text="easy apply",
+        )
 
     def apply_to_jobs(self, jobs):
         self.logger.info("Starting job application process")
         applied_count = 0
 
-        for index, job_card in enumerate(jobs, 1):
+        for index, job in enumerate(jobs, 1):
             if not self.should_continue():
                 break
 
-            try:
-                self.logger.info(f"Checking job {index}")
-
-                # Try multiple selectors for job title
-                title_selectors = [
-                    "a.job-card-list__title",
-                    "h3.job-card-list__title",
-                    "a.disabled.ember-view.job-card-container__link.job-card-list__title",
-                    ".job-card-container__link",
-                    ".jobs-search-results__list-item-title",
-                ]
-
-                job_title_element = None
-                for selector in title_selectors:
+            if self.query_quota_reached(job.query):
+                continue
+
+            job_id = job.job_id
+            # Stays None if the run is interrupted, so the job is retried on resume
+            outcome = None
+            with metrics.span("apply.job", job_id=job_id) as span:
+                try:
+                    self.logger.info(f"Checking job {index}")
+                    self.job_index.mark(job_id, SEEN)
+                    self.journal.record(session_journal.OPENED, job_id=job_id)
+
+                    self.logger.info(f"Found job: {job.title} at {job.company}")
+                    self.random_delay(1, 2)
+                    if not self.open_job(job):
+                        self.logger.error("Could not open job")
+                        outcome = FAILED
+                        continue
+
+                    self.job_context = ""
+                    self.random_delay(2, 3)
+
+                    # Check for Easy Apply once the details pane shows an apply button
                     try:
-                        job_title_element = job_card.find_element(
-                            By.CSS_SELECTOR, selector
+                        WebDriverWait(self.driver, 10).until(
+                            EC.presence_of_element_located(
+                                (By.CSS_SELECTOR, ".jobs-apply-button")
+                            )
                         )
-                        if job_title_element.is_displayed():
-                            break
                     except:
+                        pass
+                    details = self.job_details.capture(self.driver, job)
+                    if details:
+                        self.job_context = details["digest"]
+                    button = self.find_easy_apply_button()
+                    if button is None:
+                        self.logger.info("Not an Easy Apply job, skipping...")
+                        self.job_index.mark(job_id, NON_EASY_APPLY)
+                        outcome = NON_EASY_APPLY
+                        span.set("outcome", outcome)
                         continue
 
-                if not job_title_element:
-                    self.logger.error("Could not find job title element")
-                    continue
-
-                # Scroll job into view and click
-                self.logger.info(f"Found job: {job_title_element.text}")
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                    job_title_element,
-                )
-                self.random_delay(1, 2)
-
-                try:
-                    job_title_element.click()
-                except:
-                    self.driver.execute_script(
-                        "arguments[0].click();", job_title_element
+                    # Warm answers for common questions while the form opens
+                    self.answer_prefetcher.prefetch_questions(
+                        self.likely_questions, self.job_context
                     )
 
-                self.random_delay(2, 3)
-
-                # Check if it's Easy Apply
-                if not self.is_easy_apply():
-                    self.logger.info("Not an Easy Apply job, skipping...")
-                    continue
+                    # Click Easy Apply button
+                    easy_apply_clicked = False
+                    try:
+                        label = button.get_attribute("aria-label")
+                        self.logger.info(f"Clicking Easy Apply button: {label}")
+                        # Scroll into view
+                        self.driver.execute_script(
+                            "arguments[0].scrollIntoView("
+                            "{behavior: 'smooth', block: 'center'});",
+                            button,
+                        )
+                        self.random_delay(1, 2)
 
-                # Click Easy Apply button with updated selectors
-                easy_apply_clicked = False
-                button_selectors = [
-                    "button.jobs-apply-button.artdeco-button--3",
-                    "button.jobs-apply-button.artdeco-button--primary",
-                    "button[data-live-test-job-apply-button]",
-                    "button.artdeco-button--primary[aria-label*='Easy Apply to']",
-                ]
+                        try:
+                            button.click()
+                        except:
+                            self.driver.execute_script("arguments[0].click();", button)
 
-                for selector in button_selectors:
-                    try:
-                        # Find all matching buttons
-                        buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for button in buttons:
-                            if button.is_displayed():
-                                aria_label = button.get_attribute(
-                                    "aria-label", ""
-                                ).lower()
-                                button_text = button.text.lower()
-
-                                if ("easy apply" in button_text) or (
-                                    "easy apply to" in aria_label
-                                ):
-                                    self.logger.info(
-                                        f"Clicking Easy Apply button: {aria_label}"
-                                    )
-                                    # Scroll into view
-                                    self.driver.execute_script(
-                                        "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                                        button,
-                                    )
-                                    self.random_delay(1, 2)
-
-                                    try:
-                                        button.click()
-                                    except:
-                                        self.driver.execute_script(
-                                            "arguments[0].click();", button
-                                        )
-
-                                    easy_apply_clicked = True
-                                    self.random_delay(2, 3)
-                                    break
-                        if easy_apply_clicked:
-                            break
+                        easy_apply_clicked = True
+                        self.random_delay(2, 3)
                     except Exception as e:
                         self.logger.debug(
-                            f"Failed to click button with selector {selector}: {str(e)}"
+                            f"Failed to click Easy Apply button: {str(e)}"
                         )
-                        continue
 
-                if not easy_apply_clicked:
-                    self.logger.error("Could not click Easy Apply button")
-                    continue
+                    if not easy_apply_clicked:
+                        self.logger.error("Could not click Easy Apply button")
+                        self.job_index.mark(
+                            job_id, FAILED, "could not click Easy Apply"
+                        )
+                        outcome = FAILED
+                        continue
 
-                self.random_delay(2, 3)
+                    self.random_delay(2, 3)
 
-                # Handle the application
-                try:
-                    self.handle_application_form()
-                    applied_count += 1
-                    self.applications_today += 1
-                    self.last_action_time = datetime.now()
+                    # Handle the application
+                    try:
+                        self.handle_application_form()
+                        applied_count += 1
+                        self.job_index.mark(job_id, APPLIED)
+                        outcome = APPLIED
+                        span.set("outcome", outcome)
+                        metrics.incr("apply.applied")
+                        self.applied_by_query[job.query] += 1
+                        self.applications_today += 1
+                        self.scheduler.try_acquire("applications")
+                        self.last_action_time = self.scheduler.clock.now()
+
+                        # Housekeeping runs inside the pause between applications
+                        self.scheduler.defer(self.selectors.save)
+                        self.scheduler.defer(self.answer_cache.purge_expired)
+                        self.random_delay(45, 90)
+                    except Exception as e:
+                        self.logger.error(f"Error in application process: {str(e)}")
+                        self.job_index.mark(job_id, FAILED, str(e))
+                        outcome = FAILED
+                        span.set("outcome", outcome)
+                        metrics.incr("apply.failed")
+                        # Try to close the application modal if it's still open
+                        try:
+                            close_button = self.driver.find_element(
+                                By.CSS_SELECTOR, "button[aria-label='Dismiss']"
+                            )
+                            close_button.click()
+                        except:
+                            pass
+                        continue
 
-                    # Add random delay between applications
-                    self.random_delay(45, 90)
                 except Exception as e:
-                    self.logger.error(f"Error in application process: {str(e)}")
-                    # Try to close the application modal if it's still open
-                    try:
-                        close_button = self.driver.find_element(
-                            By.CSS_SELECTOR, "button[aria-label='Dismiss']"
-                        )
-                        close_button.click()
-                    except:
-                        pass
+                    self.logger.error(f"Error processing job {index}: {str(e)}")
+                    outcome = FAILED
                     continue
-
-            except Exception as e:
-                self.logger.error(f"Error processing job {index}: {str(e)}")
-                continue
+                finally:
+                    # Answers still pending belong to this job; don't let them pile up
+                    self.answer_prefetcher.cancel()
+                    if outcome is not None:
+                        self.journal.record(
+                            session_journal.FINISHED, job_id=job_id, outcome=outcome
+                        )
 
             self.random_delay(3, 5)
 
@@ -404,95 +779,197 @@ class LinkedInBot:
         )
 
     def handle_application_form(self):
-        """Handle the Easy Apply form"""
-        while True:  # Loop through multi-step applications
-            try:
-                # Wait for form to load
-                time.sleep(2)
+        """Walk the Easy Apply steps until the application is confirmed"""
+        timeout = self.config.get("form_step_timeout", 15)
+        previous = None
+        # Kind of the step whose button was clicked last
+        clicked = None
+        fixing = False
+        for step in range(self.MAX_FORM_STEPS):
+            with metrics.span("form.step", step=step) as span:
+                # Returns as soon as the modal renders a new step, not after a pause
+                state = form_steps.wait_for_step(self.driver, previous, timeout)
+                if state is None:
+                    raise Exception(
+                        f"Application form did not respond within {timeout}s"
+                    )
+                span.set("kind", state["kind"])
+
+                if state["kind"] == form_steps.CONFIRMATION:
+                    self.logger.info("Application submitted")
+                    if state.get("button"):
+                        state["button"].click()
+                    return
+                if state["kind"] == form_steps.CLOSED:
+                    if clicked != form_steps.SUBMIT:
+                        # The modal went away mid-form; nothing was sent
+                        raise Exception(
+                            f"Application modal closed after a {clicked} step"
+                        )
+                    self.logger.info("Application modal closed after submitting")
+                    return
 
-                # Check for next button or submit button
-                next_button = None
                 try:
-                    next_button = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located(
-                            (
-                                By.CSS_SELECTOR,
-                                "button[aria-label='Continue to next step']",
+                    if state.get("blocked"):
+                        # Fix everything the form flagged in one pass, once
+                        invalid = [
+                            field
+                            for field in form_filler.harvest_fields(self.driver)
+                            if field["error"]
+                        ]
+                        if fixing or not invalid:
+                            raise Exception(
+                                f"Form step blocked by {state['errors']} invalid fields"
                             )
+                        fixing = True
+                        span.set("fixed_fields", len(invalid))
+                        self.logger.info(
+                            f"Fixing {len(invalid)} fields the form rejected"
                         )
-                    )
-                except:
-                    # Try to find submit button if next button isn't present
-                    try:
-                        next_button = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located(
-                                (
-                                    By.CSS_SELECTOR,
-                                    "button[aria-label='Submit application']",
-                                )
-                            )
-                        )
-                    except:
-                        break  # No more steps
-
-                # Handle form fields on current step
-                self.fill_form_fields()
-
-                # Click next/submit button
-                if next_button and next_button.is_enabled():
-                    next_button.click()
-                    time.sleep(2)
-                else:
-                    break
+                        self.fill_form_fields(invalid)
+                    else:
+                        fixing = False
+                        self.fill_form_fields(self.harvest_form_fields())
+                        self.journal.record(session_journal.STEP, step=step)
+                        if state["kind"] == form_steps.SUBMIT:
+                            self.logger.info("Submitting application")
+                            # Journaled before the click: after a crash, a
+                            # missed application beats a duplicate one
+                            self.journal.record(session_journal.SUBMITTED)
+                    previous = state["signature"]
+                    clicked = state["kind"]
+                    form_steps.advance(self.driver, state)
+                except Exception as e:
+                    self.logger.error(f"Error in application form step: {str(e)}")
+                    raise
+        raise Exception(
+            f"Application form did not finish within {self.MAX_FORM_STEPS} steps"
+        )
 
-            except Exception as e:
-                self.logger.error(f"Error in application form step: {str(e)}")
-                raise
+    def harvest_form_fields(self):
+        """Collect the empty, labelled fields of the current form step"""
+        return [
+            field
+            for field in form_filler.harvest_fields(self.driver)
+            if form_filler.needs_answer(field)
+        ]
 
-    def fill_form_fields(self):
+    def fill_form_fields(self, fields=None):
         """Fill in all fields in the current form step"""
-        # Find all input fields
-        input_fields = self.driver.find_elements(By.TAG_NAME, "input")
-        textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
+        if fields is None:
+            fields = self.harvest_form_fields()
+        if not fields:
+            return
+
+        # Each source only answers what the earlier ones could not, and an
+        # answer only counts once it fits the field (an option, a number...)
+        values = {}
+
+        def accept(answers):
+            for field in fields:
+                answer = answers.get(field["id"])
+                if field["id"] not in values and answer:
+                    value = form_filler.prepare_value(field, answer)
+                    if value is not None:
+                        values[field["id"]] = value
+
+        def pending():
+            return [field for field in fields if field["id"] not in values]
+
+        accept({field["id"]: form_filler.preset_answer(field) for field in fields})
+        # A value the form rejected came from the answer bank or GPT before;
+        # only GPT, told about the error, gets another go at it
+        accept(
+            self.answer_bank.resolve_fields(
+                [field for field in pending() if not field["value"]]
+            )
+        )
 
-        # Handle each input field
-        for field in input_fields + textareas:
+        # GPT works on the rest in the background while the local answers are
+        # typed; questions already prefetched for this job are not resent
+        questions = [self.form_question(field) for field in pending()]
+        if questions:
+            self.answer_prefetcher.prefetch_fields(questions, self.job_context)
+        filled = self.enter_values(fields, values)
+
+        prefetched = self.answer_prefetcher.collect(questions, self.job_context)
+        accept(prefetched)
+        # An answer that did not fit its field (an option not on the list)
+        # would only come back the same, so those fields are not asked again
+        unasked = [field for field in pending() if field["id"] not in prefetched]
+        if unasked:
+            accept(
+                self.gpt_handler.generate_batch_responses(
+                    [self.form_question(field) for field in unasked],
+                    self.job_context,
+                )
+            )
+        remaining = [field for field in fields if field["id"] not in filled]
+        self.enter_values(remaining, values)
+
+        for field in pending():
+            if field["required"]:
+                self.logger.warning(f"No answer for required field: {field['label']}")
+
+    def enter_values(self, fields, values):
+        """Fill the fields that have a value; returns the ids it attempted"""
+        attempted = set()
+        for field in fields:
+            value = values.get(field["id"])
+            if value is None:
+                continue
+            attempted.add(field["id"])
             try:
-                # Skip hidden or readonly fields
-                if not field.is_displayed() or field.get_attribute("readonly"):
-                    continue
-
-                # Get field label or placeholder
-                label = ""
-                try:
-                    label = (
-                        field.get_attribute("aria-label")
-                        or field.get_attribute("placeholder")
-                        or ""
-                    )
-                except:
-                    continue
-
-                if label and not field.get_attribute("value"):
-                    response = self.gpt_handler.generate_response(label)
-                    for char in response:
-                        field.send_keys(char)
-                        self.random_delay(0.1, 0.3)
-                    self.random_delay(0.5, 1.5)
-
+                form_filler.fill_field(self.driver, field, value, self.type_text)
+                self.random_delay(0.5, 1.5)
             except Exception as e:
-                self.logger.error(f"Error filling field: {str(e)}")
-                continue
+                self.logger.error("Error filling field %s: %s", field["label"], e)
+        return attempted
+
+    @staticmethod
+    def form_question(field):
+        """Question sent to GPT for a field, including any validation error"""
+        question = {"id": field["id"], "label": field["label"]}
+        if field["error"]:
+            question["label"] = f"{field['label']} ({field['error']})"
+        if field["options"]:
+            question["options"] = field["options"]
+        elif field["type"] in form_filler.NUMBER_FIELD_TYPES:
+            question["label"] += " (answer with a number)"
+        elif field["type"] == "textarea":
+            question["long"] = True
+        return question
+
+    def type_text(self, element, text):
+        """Enter text with the configured input strategy; False if it did not stick"""
+        strategy = self.config.get("input_strategy", "auto")
+        if strategy not in form_filler.INPUT_STRATEGIES:
+            self.logger.warning(f"Unknown input_strategy {strategy!r}, using auto")
+            strategy = "auto"
+        return form_filler.enter_text(
+            self.driver,
+            element,
+            text,
+            strategy=strategy,
+            chunk_size=self.config.get("input_chunk_size", 20),
+            pause=lambda: self.random_delay(0.1, 0.3),
+        )
 
     def run(self):
+        if self.driver is None:
+            self.logger.info("Daily limits reached, stopping bot")
+            self.job_index.close()
+            self.job_details.close()
+            self.journal.close()
+            return
+
         try:
             self.logger.info("Starting LinkedIn Bot")
             if not self.should_continue():
                 self.logger.info("Daily limits reached, stopping bot")
                 return
 
-            jobs = self.search_jobs()
-            self.apply_to_jobs(jobs)
+            self.apply_to_jobs(self.job_queue())
 
         except Exception as e:
             self.logger.error(f"Critical error: {str(e)}")
@@ -500,6 +977,33 @@ class LinkedInBot:
             self.logger.info(
                 f"Session summary: Applied to {self.applications_today} jobs"
             )
+            budget = self.scheduler.remaining()
+            self.logger.info(
+                f"Remaining budget: {budget['applications']:.0f} applications, "
+                f"{budget['session_seconds'] / 60:.0f} session minutes; "
+                f"{self.scheduler.total_delay:.0f}s spent in deliberate delays"
+            )
+            stats = self.gpt_handler.cache_stats()
+            if stats:
+                self.logger.info(
+                    f"Answer cache: {stats['hits']} hits, {stats['misses']} misses "
+                    f"({stats['hit_rate']:.0%} hit rate)"
+                )
+            if self.answer_bank.fields_seen:
+                self.logger.info(
+                    f"Answered {self.answer_bank.resolved_fraction():.0%} of "
+                    f"{self.answer_bank.fields_seen} form fields without GPT"
+                )
+            self.selectors.log_summary()
+            self.selectors.save()
+            self.answer_prefetcher.shutdown()
+            self.llm_client.close()
+            self.answer_cache.close()
+            self.job_index.close()
+            self.job_details.close()
+            self.journal.close()
+            metrics.log_summary()
+            metrics.close()
             self.logger.info("Shutting down LinkedIn Bot")
             self.driver.quit()
 
@@ -0,0 +1,185 @@
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from instrumentation import metrics
+
+# Statuses worth retrying: timeouts, conflicts, rate limits and server errors
+RETRY_STATUSES = (408, 409, 429)
+
+
+class LLMClient:
+    """Chat completions over one pooled HTTP client.
+
+    The OpenAI client and its httpx connection pool are created on first use
+    and shared by every request and thread. Each attempt is bounded by the
+    configured timeouts; rate limits, server errors, timeouts and dropped
+    connections are retried with jittered exponential backoff, honouring a
+    Retry-After header when the server sends one. Other errors are raised
+    straight away.
+
+    base_url points the client at any OpenAI-compatible endpoint, such as the
+    replay harness stub.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        model: str = "gpt-4",
+        fast_model: Optional[str] = None,
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        max_retries: int = 4,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        max_connections: int = 4,
+        stream: bool = False,
+    ):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model = model
+        # Used for short answers; the main model when not configured
+        self.fast_model = fast_model or model
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_connections = max_connections
+        self.stream = stream
+        self._client = None
+        self._http = None
+        self._lock = threading.Lock()
+
+    def model_for(self, long: bool = False) -> str:
+        return self.model if long else self.fast_model
+
+    def _sdk_client(self):
+        """Create the client on first use; the OpenAI SDK is slow to import"""
+        with self._lock:
+            if self._client is None:
+                import httpx
+                import openai
+
+                timeout = httpx.Timeout(self.timeout, connect=self.connect_timeout)
+                self._http = httpx.Client(
+                    timeout=timeout,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+                # Retries are handled here, so the SDK's own are disabled
+                self._client = openai.OpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    timeout=timeout,
+                    max_retries=0,
+                    http_client=self._http,
+                )
+            return self._client
+
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        stream: Optional[bool] = None,
+    ) -> str:
+        """Text of the completion for messages, retrying transient failures"""
+        model = model or self.model
+        stream = self.stream if stream is None else stream
+        client = self._sdk_client()
+        request = {"model": model, "messages": messages}
+        if max_tokens:
+            request["max_tokens"] = max_tokens
+
+        with metrics.span("gpt.request", model=model, stream=stream) as span:
+            attempt = 0
+            while True:
+                started = time.perf_counter()
+                try:
+                    if stream:
+                        text, usage = self._stream(client, request, started)
+                    else:
+                        response = client.chat.completions.create(**request)
+                        text = response.choices[0].message.content or ""
+                        usage = response.usage
+                    break
+                except Exception as e:
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    attempt += 1
+                    metrics.incr("gpt.retries")
+                    self.logger.warning(
+                        f"GPT request failed ({type(e).__name__}), "
+                        f"retry {attempt} of {self.max_retries} in {delay:.1f}s"
+                    )
+                    time.sleep(delay)
+
+            metrics.observe("gpt.latency_seconds", time.perf_counter() - started)
+            span.set("attempts", attempt + 1)
+            if usage is not None:
+                span.set("prompt_tokens", usage.prompt_tokens)
+                span.set("completion_tokens", usage.completion_tokens)
+                metrics.observe("gpt.prompt_tokens", usage.prompt_tokens)
+                metrics.observe("gpt.completion_tokens", usage.completion_tokens)
+        return text.strip()
+
+    def _stream(self, client, request: Dict, started: float):
+        """Read a streamed completion; usage arrives with the final chunk"""
+        parts = []
+        usage = None
+        response = client.chat.completions.create(
+            stream=True, stream_options={"include_usage": True}, **request
+        )
+        try:
+            for chunk in response:
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage
+                for choice in chunk.choices:
+                    delta = choice.delta.content
+                    if not delta:
+                        continue
+                    if not parts:
+                        metrics.observe(
+                            "gpt.first_token_seconds", time.perf_counter() - started
+                        )
+                    parts.append(delta)
+        finally:
+            response.close()
+        return "".join(parts), usage
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying error, or None if it is final"""
+        import openai
+
+        if attempt >= self.max_retries:
+            return None
+        if isinstance(error, openai.APIStatusError):
+            status = error.status_code
+            if status not in RETRY_STATUSES and status < 500:
+                return None
+            retry_after = error.response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.backoff_max)
+                except ValueError:
+                    pass
+        elif not isinstance(error, openai.APIConnectionError):
+            # Timeouts are connection errors too; anything else is a bug
+            return None
+        # Full jitter keeps concurrent retries from arriving together
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def close(self):
+        with self._lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+                self._client = None
@@ -1,22 +1,67 @@
+import atexit
+import copy
+import json
 import logging
-import colorlog
+import logging.handlers
 import os
+import queue
+import colorlog
+
+LOGGER_NAME = "linkedin_bot"
+
+# Listener draining the log queue on a background thread, when async logging is on
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers and jq"""
+
+    def format(self, record):
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queues records with only the message merged, leaving layout to the listener"""
+
+    def prepare(self, record):
+        # Args are merged now since they may change before the listener runs
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
-def setup_logger():
-    """Set up logger with color formatting"""
-    logger = logging.getLogger("linkedin_bot")
-    logger.setLevel(logging.DEBUG)
+_exception_formatter = logging.Formatter()
 
-    # Create handlers
+
+def _build_handlers(log_dir, json_format, max_bytes, backup_count):
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
 
     # Create log directory if it doesn't exist
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
 
-    file_handler = logging.FileHandler("logs/linkedin_bot.log")
+    file_name = "linkedin_bot.jsonl" if json_format else "linkedin_bot.log"
+    file_handler = logging.handlers.RotatingFileHandler(
+        os.path.join(log_dir, file_name),
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8",
+    )
     file_handler.setLevel(logging.DEBUG)
 
     # Create formatters and add it to handlers
@@ -31,14 +76,65 @@ def setup_logger():
             "CRITICAL": "red,bg_white",
         },
     )
-
-    file_format = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    if json_format:
+        file_format = JsonFormatter()
+    else:
+        file_format = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
     console_handler.setFormatter(console_format)
     file_handler.setFormatter(file_format)
+    return [console_handler, file_handler]
+
+
+def setup_logger(
+    level=logging.DEBUG,
+    async_logging=True,
+    json_format=False,
+    log_dir="logs",
+    max_bytes=5 * 1024 * 1024,
+    backup_count=5,
+):
+    """Set up the bot logger once; later calls return it unchanged.
 
-    # Add handlers to the logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    With async_logging the calling thread only puts records on a queue and a
+    QueueListener thread does the formatting and file/console I/O.
+    """
+    global _listener
+    logger = logging.getLogger(LOGGER_NAME)
+    if getattr(logger, "_bot_configured", False):
+        return logger
 
+    logger.setLevel(level)
+    # Records stop here instead of also reaching any root handlers
+    logger.propagate = False
+    handlers = _build_handlers(log_dir, json_format, max_bytes, backup_count)
+
+    if async_logging:
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+        logger.addHandler(_QueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+    logger._bot_configured = True
     return logger
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+    logger._bot_configured = False
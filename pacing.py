@@ -0,0 +1,182 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from instrumentation import metrics
+
+
+class SystemClock:
+    """Real monotonic time"""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock:
+    """Clock whose sleep only advances a counter, for tests and benchmarks"""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        with self._lock:
+            return self._now
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            with self._lock:
+                self._now += seconds
+
+    advance = sleep
+
+
+class TokenBucket:
+    """Classic token bucket; a refill rate of 0 makes it a fixed quota"""
+
+    def __init__(
+        self, capacity: float, refill_per_second: float, clock, tokens=None
+    ):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.clock = clock
+        self.tokens = capacity if tokens is None else min(tokens, capacity)
+        self._updated = clock.now()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock.now()
+        elapsed = now - self._updated
+        self._updated = now
+        if elapsed > 0 and self.refill_per_second:
+            self.tokens = min(
+                self.capacity, self.tokens + elapsed * self.refill_per_second
+            )
+
+    def try_acquire(self, amount: float = 1) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return True
+            return False
+
+    def wait_time(self, amount: float = 1) -> Optional[float]:
+        """Seconds until amount tokens are available, None if that never happens"""
+        with self._lock:
+            self._refill()
+            missing = amount - self.tokens
+            if missing <= 0:
+                return 0.0
+            if not self.refill_per_second or amount > self.capacity:
+                return None
+            return missing / self.refill_per_second
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self.tokens
+
+
+class QuotaExhausted(Exception):
+    """Raised when a bucket without refill has run dry"""
+
+
+class PacingScheduler:
+    """Central place for every deliberate wait the bot makes.
+
+    Rate limits are token buckets on a pluggable clock, and time spent
+    waiting is used to run deferred background work before actually sleeping.
+    """
+
+    def __init__(
+        self,
+        clock=None,
+        applications_per_day: int = 15,
+        applications_done: int = 0,
+        gpt_calls_per_minute: float = 20,
+        page_loads_per_minute: float = 10,
+        session_seconds: float = 4 * 3600,
+    ):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.clock = clock or SystemClock()
+        self.session_start = self.clock.now()
+        self.session_seconds = session_seconds
+        self.buckets = {
+            # The daily quota does not refill within a session
+            "applications": TokenBucket(
+                applications_per_day,
+                0,
+                self.clock,
+                tokens=applications_per_day - applications_done,
+            ),
+            "gpt_calls": TokenBucket(
+                gpt_calls_per_minute, gpt_calls_per_minute / 60, self.clock
+            ),
+            "page_loads": TokenBucket(
+                page_loads_per_minute, page_loads_per_minute / 60, self.clock
+            ),
+        }
+        self.total_delay = 0.0
+        self.idle_work_time = 0.0
+        self._idle_tasks = deque()
+        # Deferred work may touch the browser, so only the owning thread runs it
+        self._owner = threading.get_ident()
+
+    def defer(self, task: Callable):
+        """Queue work to run during the next wait"""
+        self._idle_tasks.append(task)
+
+    def sleep(self, seconds: float):
+        """Wait for seconds, running deferred work first"""
+        if seconds <= 0:
+            return
+        deadline = self.clock.now() + seconds
+        if threading.get_ident() == self._owner:
+            self.total_delay += seconds
+            metrics.incr("pacing.delay_seconds", seconds)
+            while self._idle_tasks and self.clock.now() < deadline:
+                task = self._idle_tasks.popleft()
+                started = self.clock.now()
+                try:
+                    task()
+                except Exception as e:
+                    self.logger.error(f"Deferred task failed: {str(e)}")
+                self.idle_work_time += self.clock.now() - started
+        self.clock.sleep(deadline - self.clock.now())
+
+    def delay(self, min_seconds: float, max_seconds: float):
+        """Random human-like pause"""
+        self.sleep(random.uniform(min_seconds, max_seconds))
+
+    def try_acquire(self, name: str) -> bool:
+        return self.buckets[name].try_acquire()
+
+    def acquire(self, name: str):
+        """Take one token, waiting for the bucket to refill if needed"""
+        bucket = self.buckets[name]
+        while not bucket.try_acquire():
+            wait = bucket.wait_time()
+            if wait is None:
+                raise QuotaExhausted(name)
+            self.sleep(wait)
+
+    def has_budget(self, name: str) -> bool:
+        return self.buckets[name].available() >= 1
+
+    def session_expired(self) -> bool:
+        return self.clock.now() - self.session_start > self.session_seconds
+
+    def remaining(self) -> Dict[str, float]:
+        budget = {name: bucket.available() for name, bucket in self.buckets.items()}
+        budget["session_seconds"] = max(
+            0.0, self.session_seconds - (self.clock.now() - self.session_start)
+        )
+        return budget
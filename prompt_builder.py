@@ -0,0 +1,149 @@
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from instrumentation import metrics
+from tfidf import TfidfIndex
+
+# Sections are split into chunks of roughly this many tokens before indexing
+CHUNK_TOKENS = 120
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English)"""
+    return (len(text) + 3) // 4
+
+
+def truncate_tokens(text: str, budget: int) -> str:
+    if estimate_tokens(text) <= budget:
+        return text
+    return text[: budget * 4].rsplit(" ", 1)[0] + " ..."
+
+
+class PromptBuilder:
+    """Picks the resume excerpts worth sending with a question.
+
+    The whole resume is used while it fits in token_budget. Longer resumes are
+    split into section chunks, and the chunks most similar to the question
+    (TF-IDF cosine) are sent in resume order until the budget is spent. The
+    contact chunk is always kept. When nothing matches, a one-time summary from
+    summary_loader is used instead, or an extract of the summary, skills, job
+    titles and education if there is no loader.
+    """
+
+    def __init__(
+        self,
+        resume_text: str,
+        sections: Optional[Dict[str, str]] = None,
+        token_budget: int = 600,
+        summary_loader: Optional[Callable[[], str]] = None,
+    ):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.resume_text = resume_text
+        self.sections = sections or {"resume": resume_text}
+        self.token_budget = token_budget
+        self.summary_loader = summary_loader
+        self.resume_tokens = estimate_tokens(resume_text)
+        self._summary = None
+        self._summary_lock = threading.Lock()
+
+        self.chunks = self._chunk(self.sections)
+        self.chunk_tokens = [estimate_tokens(text) for _, text in self.chunks]
+        # The section name is indexed too, so "education" matches its section
+        self.index = TfidfIndex([f"{name} {text}" for name, text in self.chunks])
+
+    def resume_context(self, question: str) -> str:
+        """Resume text to send with question, within the token budget"""
+        if self.resume_tokens <= self.token_budget:
+            context = self.resume_text
+        else:
+            context = self._select(question) or self.summary()
+        tokens = estimate_tokens(context)
+        metrics.observe("prompt.resume_tokens", tokens)
+        metrics.incr("prompt.resume_tokens_saved", self.resume_tokens - tokens)
+        return context
+
+    def summary(self) -> str:
+        """Resume summary, generated once and reused"""
+        with self._summary_lock:
+            if self._summary is None:
+                summary = ""
+                if self.summary_loader is not None:
+                    try:
+                        summary = self.summary_loader()
+                    except Exception as e:
+                        self.logger.error(f"Error summarizing resume: {str(e)}")
+                self._summary = truncate_tokens(
+                    summary or self._extract_summary(), self.token_budget
+                )
+            return self._summary
+
+    def _select(self, question: str) -> str:
+        scores = self.index.scores(question)
+        chosen = []
+        used = 0
+        # Contact details are short and needed for many form questions
+        contact_budget = self.token_budget // 5
+        for position, (name, _) in enumerate(self.chunks):
+            tokens = self.chunk_tokens[position]
+            if name == "contact" and used + tokens <= contact_budget:
+                chosen.append(position)
+                used += tokens
+        matched = False
+        for position in np.argsort(-scores, kind="stable"):
+            if scores[position] <= 0:
+                break
+            if position in chosen:
+                continue
+            if used + self.chunk_tokens[position] > self.token_budget:
+                continue
+            chosen.append(int(position))
+            used += self.chunk_tokens[position]
+            matched = True
+        if not matched:
+            return ""
+        return self._render(sorted(chosen))
+
+    def _render(self, positions: List[int]) -> str:
+        parts = []
+        current = None
+        for position in positions:
+            name, text = self.chunks[position]
+            if name != current:
+                parts.append(f"{name.title()}:")
+                current = name
+            parts.append(text)
+        return "\n".join(parts)
+
+    def _extract_summary(self) -> str:
+        parts = [
+            self.sections.get("summary", ""),
+            self.sections.get("skills", ""),
+            "\n".join(
+                line
+                for line in self.sections.get("experience", "").splitlines()
+                if not line.lstrip().startswith(("-", "•", "*"))
+            ),
+            self.sections.get("education", ""),
+        ]
+        summary = "\n".join(part for part in parts if part)
+        return summary or self.resume_text
+
+    @staticmethod
+    def _chunk(sections: Dict[str, str]):
+        chunks = []
+        for name, text in sections.items():
+            lines = []
+            size = 0
+            for line in text.splitlines():
+                if lines and size + estimate_tokens(line) > CHUNK_TOKENS:
+                    chunks.append((name, "\n".join(lines)))
+                    lines = []
+                    size = 0
+                lines.append(line)
+                size += estimate_tokens(line)
+            if lines:
+                chunks.append((name, "\n".join(lines)))
+        return chunks
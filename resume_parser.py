@@ -1,17 +1,107 @@
-from docx import Document
-import PyPDF2
+import hashlib
+import json
 import os
 import logging
+import re
+from datetime import date
+from typing import Dict, List
+from instrumentation import metrics
+
+# Bump when the cached layout changes so stale entries are re-parsed
+PARSE_VERSION = 3
+
+# Section name -> headings that start it (matched against a whole line)
+SECTION_HEADINGS = {
+    "summary": ("summary", "professional summary", "profile", "objective", "about"),
+    "experience": (
+        "experience",
+        "work experience",
+        "professional experience",
+        "employment",
+        "employment history",
+        "work history",
+    ),
+    "skills": ("skills", "technical skills", "core skills", "key skills"),
+    "education": ("education", "academic background"),
+    "certifications": ("certifications", "certificates", "licenses"),
+    "projects": ("projects", "selected projects"),
+}
+
+HEADING_PATTERN = re.compile(
+    r"^\s*(%s)\s*:?\s*$"
+    % "|".join(
+        re.escape(heading)
+        for headings in SECTION_HEADINGS.values()
+        for heading in headings
+    ),
+    re.IGNORECASE,
+)
+DATE_RANGE_PATTERN = re.compile(
+    r"((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now)",
+    re.IGNORECASE,
+)
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"\+?\(?\d[\d \t().-]{7,}\d")
+# Separates the name from other details on a "Jane Doe | jane@x.com" line
+NAME_SEPARATOR_PATTERN = re.compile(r"\s*[|•·,;]\s*|\s+[-–—]\s+")
+# "Austin, TX" or "London, United Kingdom" on the contact lines
+CITY_PATTERN = re.compile(r"\b[A-Z][A-Za-z .'-]+,\s*[A-Z][A-Za-z]+(?: [A-Z][A-Za-z]+)*")
+URL_PATTERN = re.compile(r"(?:https?://)?(?:www\.)?(?:linkedin|github)\.com/\S+")
+WORD_PATTERN = re.compile(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or our the to with "
+    "was were will i me my we you your this that these those".split()
+)
+
+
+def keywords(text: str) -> List[str]:
+    """Lowercased content words of text, in order, without stopwords"""
+    return [
+        word
+        for word in WORD_PATTERN.findall(text.lower())
+        if word not in STOPWORDS and len(word) > 1
+    ]
 
 
 class ResumeParser:
-    def __init__(self, resume_path):
+    def __init__(self, resume_path, cache_dir="cache/resumes"):
         self.resume_path = resume_path
+        self.cache_dir = cache_dir
         self.logger = logging.getLogger("linkedin_bot")
-        self.resume_text = self._parse_resume()
+        self.resume_text = ""
+        self.sections = {}
+        self.contact = {}
+        self.experience = []
+        self.skills = []
+        self.keyword_index = {}
+        self._load(self._parse_resume())
 
+    @metrics.timed("resume.parse")
     def _parse_resume(self):
-        """Parse resume content based on file type"""
+        """Parsed resume from the disk cache, or freshly extracted and cached"""
+        if not self.cache_dir:
+            return self._structure(self._extract_text())
+
+        with open(self.resume_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        cache_path = os.path.join(self.cache_dir, f"{digest}.json")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    parsed = json.load(f)
+                if parsed.get("version") == PARSE_VERSION:
+                    self.logger.debug("Loaded parsed resume from cache")
+                    return parsed
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable resume cache: {str(e)}")
+
+        parsed = self._structure(self._extract_text())
+        self._save(cache_path, parsed)
+        return parsed
+
+    def _extract_text(self):
+        """Extract text based on file type"""
         if self.resume_path.endswith(".pdf"):
             return self._parse_pdf()
         elif self.resume_path.endswith(".docx"):
@@ -25,12 +115,15 @@ class ResumeParser:
 
     def _parse_pdf(self):
         """Extract text from PDF file"""
+        # Imported here: only needed for PDF resumes and slow to import
+        import PyPDF2
+
         try:
             with open(self.resume_path, "rb") as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                text = "\n".join(
+                    page.extract_text() or "" for page in pdf_reader.pages
+                )
                 self.logger.debug("Successfully parsed PDF resume")
                 return text.strip()
         except Exception as e:
@@ -39,13 +132,173 @@ class ResumeParser:
 
     def _parse_docx(self):
         """Extract text from DOCX file"""
+        from docx import Document
+
         doc = Document(self.resume_path)
-        return " ".join([paragraph.text for paragraph in doc.paragraphs])
+        # One line per paragraph so section headings stay recognisable
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs)
 
     def _parse_txt(self):
         """Extract text from TXT file"""
         with open(self.resume_path, "r", encoding="utf-8") as file:
             return file.read()
 
+    def _structure(self, text: str) -> Dict:
+        """Split resume text into sections, contact details, jobs and keywords"""
+        sections = {"contact": []}
+        current = "contact"
+        for line in text.splitlines():
+            match = HEADING_PATTERN.match(line)
+            if match:
+                heading = match.group(1).lower()
+                current = next(
+                    name
+                    for name, headings in SECTION_HEADINGS.items()
+                    if heading in headings
+                )
+                sections.setdefault(current, [])
+                continue
+            if line.strip():
+                sections[current].append(line.strip())
+
+        contact_text = "\n".join(sections["contact"])
+        contact = {}
+        # Email and phone only count on the contact lines: elsewhere a phone
+        # pattern matches date ranges and figures
+        email = EMAIL_PATTERN.search(contact_text)
+        if email:
+            contact["email"] = email.group(0)
+        phone = self._phone(contact_text)
+        if phone:
+            contact["phone"] = phone
+        url = URL_PATTERN.search(contact_text) or URL_PATTERN.search(text)
+        if url:
+            contact["url"] = url.group(0)
+        if sections["contact"]:
+            name = self._name(sections["contact"][0])
+            if name:
+                contact["name"] = name
+        for part in re.split(r"[|\n•·]", "\n".join(sections["contact"][1:])):
+            match = CITY_PATTERN.fullmatch(part.strip())
+            if match:
+                contact["city"] = match.group(0)
+                break
+
+        section_text = {name: "\n".join(lines) for name, lines in sections.items()}
+        keyword_index = {}
+        for name, body in section_text.items():
+            for word in set(keywords(body)):
+                keyword_index.setdefault(word, []).append(name)
+
+        return {
+            "version": PARSE_VERSION,
+            "text": text,
+            "sections": section_text,
+            "contact": contact,
+            "experience": self._experience_entries(sections.get("experience", [])),
+            "skills": self._skill_list(sections.get("skills", [])),
+            "keyword_index": keyword_index,
+        }
+
+    @staticmethod
+    def _phone(text: str) -> str:
+        for match in PHONE_PATTERN.finditer(text):
+            candidate = match.group(0).strip()
+            if DATE_RANGE_PATTERN.fullmatch(candidate):
+                continue
+            if sum(char.isdigit() for char in candidate) >= 7:
+                return candidate
+        return ""
+
+    @staticmethod
+    def _name(line: str) -> str:
+        """The first line up to a separator or the first email or phone number"""
+        cut = len(line)
+        for pattern in (EMAIL_PATTERN, PHONE_PATTERN, NAME_SEPARATOR_PATTERN):
+            match = pattern.search(line)
+            if match:
+                cut = min(cut, match.start())
+        return line[:cut].strip()
+
+    @staticmethod
+    def _experience_entries(lines: List[str]) -> List[Dict]:
+        """Group experience lines into jobs, each starting at a date range"""
+        entries = []
+        for line in lines:
+            match = DATE_RANGE_PATTERN.search(line)
+            if match or not entries:
+                end = match.group(2) if match else ""
+                entries.append(
+                    {
+                        "title": DATE_RANGE_PATTERN.sub("", line).strip(" ()|,-–—"),
+                        "start_year": int(match.group(1)) if match else None,
+                        "end_year": int(end) if end.isdigit() else None,
+                        "current": bool(match) and not end.isdigit(),
+                        "details": [],
+                    }
+                )
+            else:
+                entries[-1]["details"].append(line.lstrip("-•* ").strip())
+        return entries
+
+    @staticmethod
+    def _skill_list(lines: List[str]) -> List[str]:
+        skills = []
+        for line in lines:
+            for skill in re.split(r"[,;|•·]", line.split(":", 1)[-1]):
+                skill = skill.strip(" -*")
+                if skill and skill.lower() not in (s.lower() for s in skills):
+                    skills.append(skill)
+        return skills
+
+    def _save(self, cache_path: str, parsed: Dict):
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(parsed, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache parsed resume: {str(e)}")
+
+    def _load(self, parsed: Dict):
+        self.resume_text = parsed["text"]
+        self.sections = parsed["sections"]
+        self.contact = parsed["contact"]
+        self.experience = parsed["experience"]
+        self.skills = parsed["skills"]
+        self.keyword_index = parsed["keyword_index"]
+
     def get_resume_content(self):
         return self.resume_text
+
+    def get_section(self, name: str) -> str:
+        return self.sections.get(name, "")
+
+    def relevant_sections(self, text: str) -> List[str]:
+        """Section names sharing keywords with text, most overlapping first"""
+        scores = {}
+        for word in set(keywords(text)):
+            for name in self.keyword_index.get(word, ()):
+                scores[name] = scores.get(name, 0) + 1
+        return sorted(scores, key=lambda name: -scores[name])
+
+    def years_of_experience(self, skill: str = "") -> int:
+        """Years covered by the dated experience entries, overlaps counted once.
+
+        With a skill, only entries mentioning it in the title or details count.
+        """
+        this_year = date.today().year
+        pattern = re.compile(rf"(?<!\w){re.escape(skill)}(?!\w)", re.IGNORECASE)
+        years = set()
+        for entry in self.experience:
+            if entry["start_year"] is None:
+                continue
+            if skill and not pattern.search(
+                " ".join([entry["title"]] + entry["details"])
+            ):
+                continue
+            end = this_year if entry["current"] else entry["end_year"] or this_year
+            years.update(range(entry["start_year"], end))
+        return len(years)
@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, List
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# Evaluates every candidate selector in one round trip. Returns the indices of
+# the candidates that matched and the elements of the first one that did.
+RACE_SELECTORS_SCRIPT = """
+const [selectors, scope, visibleOnly, text] = arguments;
+const root = scope || document;
+const isVisible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const accepts = (el) => {
+    if (visibleOnly && !isVisible(el)) return false;
+    if (!text) return true;
+    const haystack = ((el.innerText || '') + ' ' + (el.getAttribute('aria-label') || '')).toLowerCase();
+    return haystack.includes(text);
+};
+
+const matched = [];
+let elements = [];
+selectors.forEach((selector, index) => {
+    let found;
+    try {
+        found = Array.from(root.querySelectorAll(selector)).filter(accepts);
+    } catch (e) {
+        return;
+    }
+    if (found.length) {
+        matched.push(index);
+        if (!elements.length) elements = found;
+    }
+});
+return {matched: matched, elements: elements};
+"""
+
+
+class SelectorRegistry:
+    """Ranks candidate selectors per role by how often they matched recently"""
+
+    def __init__(self, path: str = "cache/selector_stats.json", decay: float = 0.9):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.path = path
+        # Older observations are scaled down so a selector LinkedIn retired
+        # drops in the ranking after a few misses
+        self.decay = decay
+        self.stats = self._load()
+        self.lookups = {}
+
+    def _load(self) -> Dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable selector stats: {str(e)}")
+            return {}
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.stats, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _score(self, role: str, selector: str) -> float:
+        entry = self.stats.get(role, {}).get(selector)
+        if not entry:
+            return 0.5
+        # Laplace-smoothed success rate
+        return (entry["hits"] + 1) / (entry["hits"] + entry["misses"] + 2)
+
+    def rank(self, role: str, candidates: List[str]) -> List[str]:
+        """Order candidates by recent success rate, keeping the given order on ties"""
+        return sorted(candidates, key=lambda selector: -self._score(role, selector))
+
+    def record(self, role: str, candidates: List[str], matched: List[str]):
+        role_stats = self.stats.setdefault(role, {})
+        for selector in candidates:
+            entry = role_stats.setdefault(selector, {"hits": 0.0, "misses": 0.0})
+            entry["hits"] *= self.decay
+            entry["misses"] *= self.decay
+            if selector in matched:
+                entry["hits"] += 1
+            else:
+                entry["misses"] += 1
+
+    def find(
+        self,
+        driver,
+        role: str,
+        candidates: List[str],
+        timeout: float = 0,
+        scope=None,
+        visible: bool = True,
+        text: str = "",
+        serial_timeout: float = 0,
+    ):
+        """Race all candidates for a role and return (selector, elements).
+
+        All candidates are checked in a single script call per poll, so one
+        wait of ``timeout`` seconds replaces one wait per candidate.
+        ``serial_timeout`` is what each miss used to cost when candidates
+        were waited on one after another; it is only used for the time-saved
+        estimate in the logs. Returns (None, []) when nothing matched.
+        """
+        ranked = self.rank(role, candidates)
+        started = time.monotonic()
+
+        def race(d):
+            result = d.execute_script(
+                RACE_SELECTORS_SCRIPT, ranked, scope, visible, text.lower()
+            )
+            return result if result and result["matched"] else False
+
+        try:
+            if timeout:
+                result = WebDriverWait(driver, timeout, poll_frequency=0.25).until(race)
+            else:
+                result = race(driver)
+        except TimeoutException:
+            result = False
+
+        elapsed = time.monotonic() - started
+        matched = [ranked[index] for index in result["matched"]] if result else []
+        self.record(role, candidates, matched)
+
+        lookup = self.lookups.setdefault(
+            role, {"count": 0, "first_try": 0, "saved": 0.0}
+        )
+        lookup["count"] += 1
+        if not matched:
+            self.logger.debug("No selector matched for %s", role)
+            return None, []
+
+        selector = matched[0]
+        if selector == ranked[0]:
+            lookup["first_try"] += 1
+        if serial_timeout:
+            serial_cost = candidates.index(selector) * serial_timeout
+            lookup["saved"] += max(0.0, serial_cost - elapsed)
+
+        self.logger.debug("Selector for %s: %s (%.2fs)", role, selector, elapsed)
+        return selector, result["elements"]
+
+    def find_element(self, driver, role: str, candidates: List[str], **kwargs):
+        """Like find() but returns only the first matching element, or None"""
+        _, elements = self.find(driver, role, candidates, **kwargs)
+        return elements[0] if elements else None
+
+    def log_summary(self):
+        for role, lookup in sorted(self.lookups.items()):
+            rate = lookup["first_try"] / lookup["count"] if lookup["count"] else 0.0
+            self.logger.info(
+                f"Selectors for {role}: {lookup['count']} lookups, "
+                f"{rate:.0%} first-try hit rate, ~{lookup['saved']:.1f}s saved"
+            )
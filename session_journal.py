@@ -0,0 +1,185 @@
+import json
+import logging
+import os
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+from job_index import APPLIED
+
+# Journal events, one JSON line each
+SESSION = "session"
+PAGE = "page"
+QUERY_DONE = "query_done"
+SEARCH_DONE = "search_done"
+OPENED = "opened"
+STEP = "step"
+SUBMITTED = "submitted"
+FINISHED = "finished"
+
+
+class SessionJournal:
+    """Append-only record of a session's progress, replayed after a crash.
+
+    Every phase boundary (a results page queued, a job opened, a form step
+    filled, an application submitted, a job finished) is appended as one JSON
+    line and synced to disk before the bot moves on. Replaying the lines gives
+    back the job queue, the jobs already finished, the job that was in progress
+    and the day's application count, so a restarted bot continues where the
+    last one stopped. A line torn by the crash is dropped on replay.
+    """
+
+    def __init__(self, path: str = "cache/journal.jsonl"):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.state = self._replay()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    @staticmethod
+    def _empty_state(day: str = "") -> Dict:
+        return {
+            "day": day,
+            # Next results page and finished state per search query
+            "next_page": {},
+            "queries_done": [],
+            "search_done": False,
+            "queue": [],
+            "finished": {},
+            "attempts": {},
+            "current": None,
+            "step": 0,
+            "submitted": False,
+            "applied": 0,
+        }
+
+    def _replay(self) -> Dict:
+        state = self._empty_state()
+        if not os.path.exists(self.path):
+            return state
+        with open(self.path, encoding="utf-8", errors="replace") as f:
+            *lines, tail = f.read().split("\n")
+        good = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            self._apply(state, entry)
+            good.append(line + "\n")
+        if tail or len(good) < len(lines):
+            self.logger.warning("Dropping a torn entry at the end of the journal")
+            self._rewrite(good)
+        return state
+
+    def _rewrite(self, lines: List[str]):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _apply(state: Dict, entry: Dict):
+        event = entry.get("event")
+        job_id = entry.get("job_id")
+        if event == SESSION:
+            state.clear()
+            state.update(SessionJournal._empty_state(entry.get("day", "")))
+        elif event == PAGE:
+            state["queue"].extend(entry.get("jobs", []))
+            state["next_page"][entry.get("query")] = entry.get("page", 0) + 1
+        elif event == QUERY_DONE:
+            state["queries_done"].append(entry.get("query"))
+        elif event == SEARCH_DONE:
+            state["search_done"] = True
+        elif event == OPENED:
+            state["current"] = job_id
+            state["step"] = 0
+            state["submitted"] = False
+            state["attempts"][job_id] = state["attempts"].get(job_id, 0) + 1
+        elif event == STEP:
+            state["step"] = entry.get("step", 0)
+        elif event == SUBMITTED:
+            state["submitted"] = True
+        elif event == FINISHED:
+            state["finished"][job_id] = entry.get("outcome")
+            if entry.get("outcome") == APPLIED:
+                state["applied"] += 1
+            if state["current"] == job_id:
+                state["current"] = None
+
+    def record(self, event: str, **data):
+        """Append one event and make sure it is on disk before returning"""
+        if event in (STEP, SUBMITTED) and "job_id" not in data:
+            data["job_id"] = self.state["current"]
+        entry = {"ts": time.time(), "event": event, **data}
+        self._apply(self.state, entry)
+        try:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not write to the session journal: {str(e)}")
+
+    def resumable(self, day: Optional[str] = None) -> bool:
+        """True when today's session stopped before working through its queue"""
+        day = day or date.today().isoformat()
+        if self.state["day"] != day:
+            return False
+        return not self.state["search_done"] or bool(self.pending_jobs())
+
+    def start(self, day: Optional[str] = None):
+        """Begin a new session, replacing the previous journal atomically"""
+        day = day or date.today().isoformat()
+        entry = {"ts": time.time(), "event": SESSION, "day": day}
+        self._file.close()
+        self._rewrite([json.dumps(entry) + "\n"])
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._apply(self.state, entry)
+
+    def pending_jobs(self) -> List[Dict]:
+        """Queued job records not finished yet, the interrupted job first"""
+        current = self.state["current"]
+        pending = []
+        queued = set()
+        for job in self.state["queue"]:
+            job_id = job.get("job_id")
+            if job_id in self.state["finished"] or (job_id and job_id in queued):
+                continue
+            queued.add(job_id)
+            if job_id == current:
+                pending.insert(0, job)
+            else:
+                pending.append(job)
+        return pending
+
+    def applied_by_query(self) -> Dict[str, int]:
+        """Applications made this session, per search query that found the job"""
+        counts = {}
+        for job in self.state["queue"]:
+            if self.state["finished"].get(job.get("job_id")) == APPLIED:
+                query = job.get("query")
+                counts[query] = counts.get(query, 0) + 1
+        return counts
+
+    def interrupted(self) -> Optional[Dict]:
+        """The job in progress when the last run stopped, if any"""
+        job_id = self.state["current"]
+        if job_id is None:
+            return None
+        return {
+            "job_id": job_id,
+            "step": self.state["step"],
+            "submitted": self.state["submitted"],
+            "attempts": self.state["attempts"].get(job_id, 0),
+        }
+
+    def close(self):
+        try:
+            self._file.close()
+        except OSError:
+            pass
@@ -0,0 +1,112 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+
+class SessionStore:
+    """Persists browser cookies and local storage between runs"""
+
+    def __init__(self, path: str = "cache/session.json", max_age_days: float = 14):
+        self.logger = logging.getLogger("linkedin_bot")
+        self.path = path
+        self.max_age_seconds = max_age_days * 24 * 3600
+
+    def load(self) -> Optional[Dict]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path) as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable session file: {str(e)}")
+            return None
+        if time.time() - session.get("saved_at", 0) > self.max_age_seconds:
+            self.logger.info("Saved session is too old, logging in again")
+            return None
+        return session
+
+    def save(self, driver):
+        session = {
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script(
+                "return Object.assign({}, window.localStorage);"
+            ),
+        }
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_path = f"{self.path}.tmp"
+        # Session cookies are as good as the password, keep them private
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(session, f)
+        os.replace(tmp_path, self.path)
+        self.logger.debug(f"Saved {len(session['cookies'])} session cookies")
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def restore_cookies(self, driver, session: Dict, base_url: str) -> bool:
+        """Install saved cookies before the first page load.
+
+        Uses the DevTools protocol (Edge and Chrome) so no page has to be
+        loaded just to get onto the cookie domain; other drivers fall back to
+        loading the site root first.
+        """
+        cookies = session.get("cookies") or []
+        if not cookies:
+            return False
+        try:
+            driver.execute_cdp_cmd(
+                "Network.setCookies", {"cookies": self._to_cdp(cookies, base_url)}
+            )
+            return True
+        except Exception as e:
+            self.logger.debug(f"DevTools cookie restore unavailable: {str(e)}")
+
+        driver.get(f"{base_url}/robots.txt")
+        for cookie in cookies:
+            cookie = dict(cookie)
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                self.logger.debug("Skipping cookie %s: %s", cookie.get("name"), e)
+        return True
+
+    @staticmethod
+    def restore_local_storage(driver, session: Dict):
+        items = session.get("local_storage") or {}
+        if items:
+            driver.execute_script(
+                "for (const [key, value] of Object.entries(arguments[0])) {"
+                " window.localStorage.setItem(key, value); }",
+                items,
+            )
+
+    @staticmethod
+    def _to_cdp(cookies: List[Dict], base_url: str) -> List[Dict]:
+        converted = []
+        for cookie in cookies:
+            entry = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            }
+            if cookie.get("domain"):
+                entry["domain"] = cookie["domain"]
+            else:
+                entry["url"] = base_url
+            if "expiry" in cookie:
+                entry["expires"] = cookie["expiry"]
+            if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+                entry["sameSite"] = cookie["sameSite"]
+            converted.append(entry)
+        return converted
@@ -0,0 +1,49 @@
+from typing import Sequence
+
+import numpy as np
+
+from resume_parser import keywords
+
+
+class TfidfIndex:
+    """L2-normalised TF-IDF vectors for a fixed set of documents.
+
+    Scoring a query is a single matrix-vector product, so the document side is
+    computed once and reused for every question.
+    """
+
+    def __init__(self, documents: Sequence[str]):
+        tokenized = [keywords(document) for document in documents]
+        self.vocabulary = {}
+        for words in tokenized:
+            for word in words:
+                self.vocabulary.setdefault(word, len(self.vocabulary))
+
+        counts = np.zeros((len(tokenized), len(self.vocabulary)), dtype=np.float32)
+        for row, words in enumerate(tokenized):
+            for word in words:
+                counts[row, self.vocabulary[word]] += 1
+        document_frequency = (counts > 0).sum(axis=0)
+        # Smoothed idf as in scikit-learn, with sublinear term frequency
+        self.idf = np.log((1 + len(tokenized)) / (1 + document_frequency)) + 1
+        self.matrix = self._normalize(np.log1p(counts) * self.idf)
+
+    def vectorize(self, text: str) -> np.ndarray:
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for word in keywords(text):
+            column = self.vocabulary.get(word)
+            if column is not None:
+                vector[column] += 1
+        return self._normalize(np.log1p(vector) * self.idf)
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity of text to every document, in document order"""
+        if not self.vocabulary:
+            return np.zeros(len(self.matrix), dtype=np.float32)
+        return self.matrix @ self.vectorize(text)
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1
+        return (vectors / norms).astype(np.float32)